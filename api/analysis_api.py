@@ -1,4 +1,7 @@
 # api/analysis_api.py
+import hashlib
+from collections import OrderedDict
+
 from fastapi import APIRouter, HTTPException
 
 from models.schemas import AnalysisRequest, FullAnalysisResponse
@@ -7,6 +10,10 @@ from services import rag_service
 # router 정의 추가
 router = APIRouter()
 
+# 동일한 뉴스 본문 재분석 방지용 LRU 결과 캐시 (키: 본문 SHA-256)
+_ANALYSIS_CACHE: OrderedDict = OrderedDict()
+_ANALYSIS_CACHE_MAX = 1024
+
 @router.post("/analysis", response_model=FullAnalysisResponse)
 async def analyze_news_issue(request: AnalysisRequest):
     """
@@ -16,13 +23,25 @@ async def analyze_news_issue(request: AnalysisRequest):
     """
     if not rag_service.is_initialized():
         raise HTTPException(status_code=503, detail="분석 서비스가 준비되지 않았습니다.")
-    
+
+    # 같은 본문이면 LLM 호출 없이 캐시된 분석 결과 반환
+    cache_key = hashlib.sha256(request.content.encode('utf-8')).hexdigest()
+    cached_result = _ANALYSIS_CACHE.get(cache_key)
+    if cached_result is not None:
+        _ANALYSIS_CACHE.move_to_end(cache_key)
+        return cached_result
+
     try:
         analysis_result = await rag_service.comprehensive_analysis(
             current_news=request.content,
             max_past_issues=3,
             max_industries=3
         )
+
+        _ANALYSIS_CACHE[cache_key] = analysis_result
+        if len(_ANALYSIS_CACHE) > _ANALYSIS_CACHE_MAX:
+            _ANALYSIS_CACHE.popitem(last=False)  # 가장 오래된 항목 제거 (LRU)
+
         return analysis_result
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"뉴스 분석 중 오류 발생: {e}")
\ No newline at end of file
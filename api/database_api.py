@@ -1,5 +1,6 @@
 # api/database_api.py
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import ORJSONResponse
 from typing import Optional, List
 
 from services import database_service
@@ -8,25 +9,30 @@ from models.schemas import PastIssue, Industry, DatabaseStats
 # router 정의 추가
 router = APIRouter()
 
-@router.get("/past-issues", response_model=List[PastIssue])
+# DB가 이미 스키마를 보장하는 조회 결과는 pydantic 재검증 없이 orjson으로 바로 직렬화
+# (response_model 대신 responses로 OpenAPI 문서만 유지)
+
+@router.get("/past-issues", responses={200: {"model": List[PastIssue]}})
 async def get_past_issues(limit: int = 20, search: Optional[str] = None, industry: Optional[str] = None):
     """SQLite DB에서 과거 뉴스 기록을 조회합니다."""
     if not database_service.is_initialized():
         raise HTTPException(status_code=503, detail="데이터베이스 서비스가 준비되지 않았습니다.")
-    
+
     try:
-        return await database_service.db_api.get_past_news(limit, search, industry)
+        rows = await database_service.db_api.get_past_news(limit, search, industry)
+        return ORJSONResponse(rows)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
-@router.get("/industries", response_model=List[Industry])
+@router.get("/industries", responses={200: {"model": List[Industry]}})
 async def get_industries(search: Optional[str] = None, limit: int = 50):
     """SQLite DB에서 산업 분류 정보를 조회합니다."""
     if not database_service.is_initialized():
         raise HTTPException(status_code=503, detail="데이터베이스 서비스가 준비되지 않았습니다.")
-    
+
     try:
-        return await database_service.db_api.get_industries(search, limit)
+        rows = await database_service.db_api.get_industries(search, limit)
+        return ORJSONResponse(rows)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -14,10 +14,10 @@ async def health_check():
     
     components = {}
     
-    # 데이터베이스 상태 확인
+    # 데이터베이스 상태 확인 (blocking 쿼리는 서비스 내부에서 스레드로 실행됨)
     try:
         db_service = get_database_service()
-        db_service.test_connection()  # await 제거 (동기 함수)
+        await db_service.test_connection()
         components["mysql_database"] = {
             "status": "ok",
             "message": "MySQL 연결 정상"
@@ -31,7 +31,7 @@ async def health_check():
     # 백그라운드 파이프라인 상태 확인
     try:
         db_service = get_database_service()
-        latest_log = db_service.get_latest_pipeline_log()  # await 제거
+        latest_log = await db_service.get_latest_pipeline_log()
         
         if latest_log and latest_log.get("final_status") == "success":
             components["background_pipeline"] = {
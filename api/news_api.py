@@ -1,76 +1,214 @@
 # api/news_api.py (안전한 버전)
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query, Request, Response
+from fastapi.responses import ORJSONResponse, StreamingResponse
+import hashlib
+import orjson
 from typing import List, Dict, Optional
 from datetime import datetime
+from collections import defaultdict
+import asyncio
 import json
+import pickle
 from pathlib import Path
+import numpy as np
 import pandas as pd
 
 from services.database_service import get_database_service
+from services.pipeline_service import load_result_json
 
 router = APIRouter()
 
 CSV_FILE_PATH = Path(__file__).parent.parent / "data" / "Past_news.csv"
+# 표준화까지 끝난 DataFrame의 Parquet 캐시 (CSV 재파싱 없이 빠른 재시작)
+PARQUET_FILE_PATH = CSV_FILE_PATH.with_suffix('.parquet')
 df_past_news = None
 
+# 검색용 소문자 배열 (요청마다 str.lower()를 다시 돌리지 않도록 로드 시 1회만 생성)
+_title_lower = None
+_summary_lower = None
+_industries_lower = None
+
+# 산업명(소문자, 공백 제거) → 행 번호 역색인 (닫힌 어휘라 dict 조회로 충분)
+_industry_index: Dict[str, "np.ndarray"] = {}
+
+
+def _build_industry_index(industries_arr) -> Dict:
+    """related_industries 셀을 ','로 분해해 산업명 → 행 번호 postings 생성"""
+    postings = defaultdict(list)
+    for row_idx, cell in enumerate(industries_arr):
+        for token in str(cell).split(','):
+            token = token.strip()
+            if token:
+                postings[token].append(row_idx)
+    return {token: np.fromiter(rows, dtype=np.int32) for token, rows in postings.items()}
+
+
+# 3-gram → 행 번호 역색인 (전체 행 스캔 대신 후보 행만 확인하기 위한 인덱스)
+TRIGRAM_INDEX_PATH = CSV_FILE_PATH.parent / "Past_news.trigram.pkl"
+_trigram_index = {}
+
+
+def _build_trigram_index(title_arr, summary_arr) -> Dict:
+    """title+summary 소문자 텍스트에서 3-gram → 행 번호 postings 생성"""
+    postings = defaultdict(set)
+    for row_idx in range(len(title_arr)):
+        text = f"{title_arr[row_idx]} {summary_arr[row_idx]}"
+        for i in range(len(text) - 2):
+            postings[text[i:i + 3]].add(row_idx)
+    # 정렬된 int32 배열로 저장해 np.intersect1d 교집합 비용 최소화
+    return {gram: np.fromiter(sorted(rows), dtype=np.int32) for gram, rows in postings.items()}
+
+
+def _load_or_build_trigram_index(title_arr, summary_arr) -> Dict:
+    """CSV보다 최신인 pickle이 있으면 재사용, 없으면 새로 빌드 후 저장"""
+    try:
+        if (TRIGRAM_INDEX_PATH.is_file() and
+                TRIGRAM_INDEX_PATH.stat().st_mtime >= CSV_FILE_PATH.stat().st_mtime):
+            with open(TRIGRAM_INDEX_PATH, 'rb') as f:
+                return pickle.load(f)
+    except Exception as e:
+        print(f"⚠️ 3-gram 인덱스 캐시 로드 실패 (재빌드): {e}")
+
+    index = _build_trigram_index(title_arr, summary_arr)
+    try:
+        with open(TRIGRAM_INDEX_PATH, 'wb') as f:
+            pickle.dump(index, f, protocol=pickle.HIGHEST_PROTOCOL)
+    except Exception as e:
+        print(f"⚠️ 3-gram 인덱스 캐시 저장 실패: {e}")
+    return index
+
+
+def _trigram_candidates(search_term: str):
+    """검색어의 3-gram postings 교집합으로 후보 행 번호 반환 (불가 시 None → 전체 스캔)"""
+    if len(search_term) < 3 or not _trigram_index:
+        return None
+
+    candidates = None
+    for i in range(len(search_term) - 2):
+        postings = _trigram_index.get(search_term[i:i + 3])
+        if postings is None:
+            return np.empty(0, dtype=np.int32)  # 해당 3-gram이 없으면 매치 불가
+        candidates = postings if candidates is None else np.intersect1d(candidates, postings, assume_unique=True)
+        if len(candidates) == 0:
+            break
+    return candidates
+
+# CSV 로드 완료 여부 (startup에서 비동기로 로드되는 동안 /past는 503 반환)
+_csv_ready = False
+# CSV 리비전 기반 ETag (파일이 바뀌지 않는 한 /past 응답은 304 가능)
+_csv_etag = None
+
+
 def load_csv_data():
     """서버 시작 시 CSV 파일을 안전하게 로드하고, 컬럼명을 표준화하는 함수"""
-    global df_past_news
+    global df_past_news, _title_lower, _summary_lower, _industries_lower, \
+        _trigram_index, _industry_index, _csv_ready, _csv_etag
     try:
         if not CSV_FILE_PATH.is_file():
             raise FileNotFoundError(f"{CSV_FILE_PATH} 파일을 찾을 수 없습니다.")
-        
-        df = pd.read_csv(CSV_FILE_PATH)
-        
-        print("✅ Past_news.csv에서 원본 그대로 읽은 컬럼명:", df.columns.tolist())
-
-        # --- ▼▼▼ 핵심 수정 부분: 실제 CSV 컬럼명을 코드 표준 컬럼명으로 매핑 ▼▼▼ ---
-        # 실제 CSV 파일의 컬럼명을 왼쪽에, 코드에서 사용할 이름을 오른쪽에 적습니다.
-        column_mapping = {
-            'ID': 'id',
-            'Issue_name': 'title',
-            'Contents': 'summary',
-            'Contentes(Spec)': 'content', # CSV 파일의 오타('Contentes')를 그대로 반영
-            'Start_date': 'start_date',
-            'Fin_date': 'end_date',
-            '근거자료': 'evidence_source',
-            '카테고리': 'related_industries'
-        }
-        df.rename(columns=column_mapping, inplace=True)
-        # --- ▲▲▲ 핵심 수정 부분 끝 ▲▲▲ ---
-        
-        df = df.fillna('')
-        if 'id' not in df.columns or df['id'].astype(str).duplicated().any():
-            df['id'] = df.index.astype(str)
-        
-        # 'source' 컬럼이 없다면 기본값으로 생성
-        if 'source' not in df.columns:
-            df['source'] = '과거 이슈 DB'
+
+        df = None
+
+        # CSV보다 최신인 Parquet 캐시가 있으면 CSV 파싱/표준화 과정 전체를 건너뜀
+        if (PARQUET_FILE_PATH.is_file() and
+                PARQUET_FILE_PATH.stat().st_mtime >= CSV_FILE_PATH.stat().st_mtime):
+            try:
+                df = pd.read_parquet(PARQUET_FILE_PATH, engine="pyarrow")
+                print(f"✅ Parquet 캐시에서 로드: {PARQUET_FILE_PATH.name}")
+            except Exception as e:
+                print(f"⚠️ Parquet 캐시 로드 실패 (CSV로 fallback): {e}")
+                df = None
+
+        if df is None:
+            # pyarrow CSV 파서 우선 사용: 멀티스레드 파싱 + Arrow 문자열 버퍼 공유로 RSS 절감
+            try:
+                import pyarrow.csv as pacsv
+                df = pacsv.read_csv(CSV_FILE_PATH).to_pandas(types_mapper=pd.ArrowDtype)
+                print("✅ pyarrow.csv로 로드 (Arrow 기반 문자열 dtype)")
+            except Exception as e:
+                print(f"⚠️ pyarrow CSV 로드 실패 (pandas 파서로 fallback): {e}")
+                df = pd.read_csv(CSV_FILE_PATH)
+
+            print("✅ Past_news.csv에서 원본 그대로 읽은 컬럼명:", df.columns.tolist())
+
+            # --- ▼▼▼ 핵심 수정 부분: 실제 CSV 컬럼명을 코드 표준 컬럼명으로 매핑 ▼▼▼ ---
+            # 실제 CSV 파일의 컬럼명을 왼쪽에, 코드에서 사용할 이름을 오른쪽에 적습니다.
+            column_mapping = {
+                'ID': 'id',
+                'Issue_name': 'title',
+                'Contents': 'summary',
+                'Contentes(Spec)': 'content', # CSV 파일의 오타('Contentes')를 그대로 반영
+                'Start_date': 'start_date',
+                'Fin_date': 'end_date',
+                '근거자료': 'evidence_source',
+                '카테고리': 'related_industries'
+            }
+            df.rename(columns=column_mapping, inplace=True)
+            # --- ▲▲▲ 핵심 수정 부분 끝 ▲▲▲ ---
+
+            df = df.fillna('')
+            if 'id' not in df.columns or df['id'].astype(str).duplicated().any():
+                df['id'] = df.index.astype(str)
+
+            # 'source' 컬럼이 없다면 기본값으로 생성
+            if 'source' not in df.columns:
+                df['source'] = '과거 이슈 DB'
+
+            # 표준화 완료된 DataFrame을 Parquet으로 캐싱 (다음 시작부터 재사용)
+            try:
+                df.to_parquet(PARQUET_FILE_PATH, engine="pyarrow", compression="zstd")
+                print(f"💾 Parquet 캐시 저장: {PARQUET_FILE_PATH.name}")
+            except Exception as e:
+                print(f"⚠️ Parquet 캐시 저장 실패 (무시): {e}")
 
         df_past_news = df
+
+        # 소문자 변환 결과를 numpy 배열로 미리 캐싱 (요청 처리 시 O(N) lower 패스 제거)
+        _title_lower = df['title'].astype(str).str.lower().to_numpy(dtype=str)
+        _summary_lower = df['summary'].astype(str).str.lower().to_numpy(dtype=str)
+        _industries_lower = df['related_industries'].astype(str).str.lower().to_numpy(dtype=str) \
+            if 'related_industries' in df.columns else np.full(len(df), '', dtype=object)
+
+        _trigram_index = _load_or_build_trigram_index(_title_lower, _summary_lower)
+        print(f"✅ 3-gram 검색 인덱스 준비 완료: {len(_trigram_index)}개 gram")
+
+        _industry_index = _build_industry_index(_industries_lower)
+        print(f"✅ 산업 필터 인덱스 준비 완료: {len(_industry_index)}개 산업")
+
+        _csv_etag = hashlib.md5(str(CSV_FILE_PATH.stat().st_mtime_ns).encode()).hexdigest()
+
         print(f"✅ Past_news.csv 데이터 표준화 및 로드 성공. 총 {len(df_past_news)}개 뉴스.")
         print("   -> 코드에서 사용할 컬럼명:", df_past_news.columns.tolist())
 
     except Exception as e:
         df_past_news = pd.DataFrame()
+        _title_lower = _summary_lower = _industries_lower = np.empty(0, dtype=object)
         print(f"❌ Past_news.csv 파일 로드/처리 실패: {e}")
+    finally:
+        _csv_ready = True
 
-load_csv_data()
-
-@router.get("/latest")
-async def get_latest_news_issues():
+@router.get("/latest", response_class=ORJSONResponse)
+async def get_latest_news_issues(request: Request, response: Response):
     """최신 뉴스 이슈들을 MySQL에서 조회하고 RAG 분석 상세 정보를 포함합니다."""
     try:
         db_service = get_database_service()
-        
+
         news_issues = await db_service.get_latest_news_issues()
-        
+
+        # 파이프라인 실행 사이에는 데이터가 바뀌지 않으므로 ETag로 304 처리
+        if news_issues and news_issues[0].get("updated_at"):
+            etag = hashlib.md5(str(news_issues[0]["updated_at"]).encode()).hexdigest()
+            if request.headers.get("if-none-match") == etag:
+                return Response(status_code=304)
+            response.headers["ETag"] = etag
+            response.headers["Cache-Control"] = "max-age=30"
+
         if not news_issues:
             # MySQL에 데이터가 없으면 fallback: 최신 JSON 파일에서 로드
             fallback_data = _load_fallback_data()
             if fallback_data:
-                # 백업 데이터에도 상세 정보 추가
-                enriched_fallback = _enrich_with_rag_details(fallback_data)
+                # 백업 데이터에도 상세 정보 추가 (CPU 작업은 스레드에서 수행)
+                enriched_fallback = await asyncio.to_thread(_enrich_with_rag_details, fallback_data)
                 return {
                     "success": True,
                     "data": {
@@ -91,8 +229,8 @@ async def get_latest_news_issues():
                     }
                 }
         
-        # MySQL 데이터에 RAG 상세 정보 추가
-        enriched_issues = _enrich_with_rag_details(news_issues)
+        # MySQL 데이터에 RAG 상세 정보 추가 (CPU 작업은 스레드에서 수행)
+        enriched_issues = await asyncio.to_thread(_enrich_with_rag_details, news_issues)
         
         return {
             "success": True,
@@ -113,34 +251,46 @@ async def get_latest_news_issues():
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"뉴스 조회 실패: {e}")
 
-@router.get("/past", summary="과거 뉴스 목록 조회(CSV 기반)", description="data/Past_news.csv 파일에서 과거 뉴스 데이터를 조회합니다.")
+@router.get("/past", response_class=ORJSONResponse, summary="과거 뉴스 목록 조회(CSV 기반)", description="data/Past_news.csv 파일에서 과거 뉴스 데이터를 조회합니다.")
 async def get_past_news(
+    request: Request,
+    response: Response,
     limit: int = 100,
     search: Optional[str] = Query(None, description="뉴스 제목 또는 내용에서 검색할 키워드"),
-    industry: Optional[str] = Query(None, description="관련 산업별로 필터링")
+    industry: Optional[str] = Query(None, description="관련 산업별로 필터링"),
+    stream: bool = Query(False, description="true면 NDJSON 스트리밍으로 응답 (대량 조회용)")
 ):
     global df_past_news
-    
+
+    if not _csv_ready:
+        raise HTTPException(status_code=503, detail="과거 뉴스 데이터(CSV)를 로드하는 중입니다. 잠시 후 다시 시도해주세요.")
+
     if df_past_news is None or df_past_news.empty:
         raise HTTPException(status_code=500, detail="서버에 과거 뉴스 데이터(CSV)가 로드되지 않았습니다.")
-    
+
+    # CSV 파일 리비전 기반 ETag (클라이언트는 URL별로 캐시)
+    if _csv_etag:
+        if request.headers.get("if-none-match") == _csv_etag:
+            return Response(status_code=304)
+        response.headers["ETag"] = _csv_etag
+        response.headers["Cache-Control"] = "max-age=30"
+
     try:
-        df_filtered = df_past_news.copy()
-
-        if search:
-            search_term = search.lower()
-            df_filtered = df_filtered[
-                df_filtered['title'].str.lower().str.contains(search_term, na=False) |
-                df_filtered['summary'].str.lower().str.contains(search_term, na=False)
-            ]
-
-        if industry:
-            df_filtered = df_filtered[
-                df_filtered['related_industries'].str.contains(industry, na=False)
-            ]
-
-        total_count = len(df_filtered)
-        df_result = df_filtered.head(limit)
+        # CPU-bound 필터링은 스레드에서 실행해 이벤트 루프 블로킹 방지
+        total_count, df_result = await asyncio.to_thread(_filter_past_news, search, industry, limit)
+
+        if stream:
+            # 행 단위 NDJSON 스트리밍: 전체 레코드를 한 번에 직렬화하지 않고 즉시 전송
+            def generate_ndjson():
+                for rec in df_result.itertuples(index=False):
+                    yield orjson.dumps(rec._asdict()) + b"\n"
+
+            return StreamingResponse(
+                generate_ndjson(),
+                media_type="application/x-ndjson",
+                headers={"X-Total-Count": str(total_count)}
+            )
+
         data_to_return = df_result.to_dict(orient='records')
 
         return {
@@ -152,11 +302,69 @@ async def get_past_news(
         print(f"❌ 과거 뉴스 처리 중 오류 발생: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
+def _filter_past_news(search: Optional[str], industry: Optional[str], limit: int):
+    """/past 필터링 본체 (동기, asyncio.to_thread로 실행됨)"""
+    # 필터 조건이 없으면 mask 계산 없이 앞에서 limit개만 슬라이스
+    if not search and not industry:
+        return len(df_past_news), df_past_news.iloc[:limit]
+
+    # DataFrame 복사 없이 미리 만들어 둔 소문자 배열로 boolean mask만 계산
+    mask = np.ones(len(df_past_news), dtype=bool)
+
+    if search:
+        search_term = search.lower()
+        candidates = _trigram_candidates(search_term)
+        if candidates is not None:
+            # 인덱스 후보 행에 대해서만 실제 substring 검증
+            hit = (np.char.find(_title_lower[candidates], search_term) >= 0) | \
+                  (np.char.find(_summary_lower[candidates], search_term) >= 0)
+            search_mask = np.zeros(len(df_past_news), dtype=bool)
+            search_mask[candidates[hit]] = True
+            mask &= search_mask
+        else:
+            # 검색어가 3글자 미만이면 전체 스캔으로 fallback
+            mask &= (np.char.find(_title_lower, search_term) >= 0) | \
+                    (np.char.find(_summary_lower, search_term) >= 0)
+
+    if industry:
+        industry_term = industry.lower().strip()
+        rows = _industry_index.get(industry_term)
+        if rows is not None:
+            # 산업명이 어휘에 정확히 있으면 O(1) postings 조회
+            industry_mask = np.zeros(len(df_past_news), dtype=bool)
+            industry_mask[rows] = True
+            mask &= industry_mask
+        else:
+            # 부분 문자열 검색 등 어휘에 없는 입력은 기존 스캔 방식 유지
+            mask &= np.char.find(_industries_lower, industry_term) >= 0
+
+    matched_indices = np.flatnonzero(mask)
+    total_count = int(len(matched_indices))
+    df_result = df_past_news.iloc[matched_indices[:limit]]
+    return total_count, df_result
+
+
+# 점수 구성 가중치 (모든 상세 항목이 공유하는 상수)
+_SCORE_WEIGHTS = {"vector_weight": 0.3, "ai_weight": 0.7}
+_EMPTY_VERIFICATION = {"is_grounded": False, "supporting_quote": ""}
+
+# (issue_id, updated_at) → enriched dict 결과 캐시
+# 새 데이터가 없는 동안 /latest 반복 호출은 딕셔너리 조회로 끝나도록 함
+_ENRICH_CACHE: Dict[tuple, Dict] = {}
+_ENRICH_CACHE_MAX = 512
+
+
 def _enrich_with_rag_details(issues: List[Dict]) -> List[Dict]:
-    """이슈 데이터에 RAG 분석의 상세 정보를 추가합니다."""
+    """이슈 데이터에 RAG 분석의 상세 정보를 추가합니다. (결과 캐시 적용)"""
     enriched = []
-    
+
     for issue in issues:
+        # id + updated_at이 같으면 이전에 만든 enriched 결과 재사용
+        cache_key = (issue.get("id"), issue.get("updated_at"))
+        if cache_key[0] is not None and cache_key in _ENRICH_CACHE:
+            enriched.append(_ENRICH_CACHE[cache_key])
+            continue
+
         enriched_issue = issue.copy()
         
         # 🔥 안전한 관련 산업 상세 정보 추가
@@ -165,26 +373,19 @@ def _enrich_with_rag_details(issues: List[Dict]) -> List[Dict]:
             detailed_industries = []
             for industry in raw_industries:
                 if isinstance(industry, dict):
-                    detailed_industry = {
+                    # verification은 한 번만 조회하고 is_grounded를 재사용
+                    verification = industry.get("verification") or _EMPTY_VERIFICATION
+                    is_grounded = verification.get("is_grounded", False)
+                    detailed_industries.append({
                         "name": industry.get("name", "산업명 없음"),
                         "final_score": industry.get("final_score", 0),
                         "vector_score": industry.get("vector_score", 0),
                         "ai_score": industry.get("ai_score", 0),
                         "ai_reason": industry.get("ai_reason", ""),
                         "description": industry.get("description", ""),
-                        # 검증 정보 안전하게 추가
-                        "verification": industry.get("verification", {
-                            "is_grounded": False,
-                            "supporting_quote": ""
-                        }),
-                        # 점수 구성 상세
-                        "score_breakdown": {
-                            "vector_weight": 0.3,
-                            "ai_weight": 0.7,
-                            "penalty_applied": not industry.get("verification", {}).get("is_grounded", True)
-                        }
-                    }
-                    detailed_industries.append(detailed_industry)
+                        "verification": verification,
+                        "score_breakdown": {**_SCORE_WEIGHTS, "penalty_applied": not is_grounded}
+                    })
                 else:
                     # 문자열이나 다른 형태인 경우 기본 구조로 변환
                     detailed_industries.append({
@@ -194,8 +395,8 @@ def _enrich_with_rag_details(issues: List[Dict]) -> List[Dict]:
                         "ai_score": 0,
                         "ai_reason": "구조 변환됨",
                         "description": "",
-                        "verification": {"is_grounded": False, "supporting_quote": ""},
-                        "score_breakdown": {"vector_weight": 0.3, "ai_weight": 0.7, "penalty_applied": True}
+                        "verification": _EMPTY_VERIFICATION,
+                        "score_breakdown": {**_SCORE_WEIGHTS, "penalty_applied": True}
                     })
             enriched_issue["관련산업_상세"] = detailed_industries
         
@@ -205,7 +406,10 @@ def _enrich_with_rag_details(issues: List[Dict]) -> List[Dict]:
             detailed_past_issues = []
             for past_issue in raw_past_issues:
                 if isinstance(past_issue, dict):
-                    detailed_past_issue = {
+                    # verification은 한 번만 조회하고 is_grounded를 재사용
+                    verification = past_issue.get("verification") or _EMPTY_VERIFICATION
+                    is_grounded = verification.get("is_grounded", False)
+                    detailed_past_issues.append({
                         "name": past_issue.get("name", "이슈명 없음"),
                         "final_score": past_issue.get("final_score", 0),
                         "vector_score": past_issue.get("vector_score", 0),
@@ -213,19 +417,9 @@ def _enrich_with_rag_details(issues: List[Dict]) -> List[Dict]:
                         "ai_reason": past_issue.get("ai_reason", ""),
                         "description": past_issue.get("description", ""),
                         "period": past_issue.get("period", "N/A"),
-                        # 검증 정보 안전하게 추가
-                        "verification": past_issue.get("verification", {
-                            "is_grounded": False,
-                            "supporting_quote": ""
-                        }),
-                        # 점수 구성 상세
-                        "score_breakdown": {
-                            "vector_weight": 0.3,
-                            "ai_weight": 0.7,
-                            "penalty_applied": not past_issue.get("verification", {}).get("is_grounded", True)
-                        }
-                    }
-                    detailed_past_issues.append(detailed_past_issue)
+                        "verification": verification,
+                        "score_breakdown": {**_SCORE_WEIGHTS, "penalty_applied": not is_grounded}
+                    })
                 else:
                     # 문자열이나 다른 형태인 경우 기본 구조로 변환
                     detailed_past_issues.append({
@@ -236,8 +430,8 @@ def _enrich_with_rag_details(issues: List[Dict]) -> List[Dict]:
                         "ai_reason": "구조 변환됨",
                         "description": "",
                         "period": "N/A",
-                        "verification": {"is_grounded": False, "supporting_quote": ""},
-                        "score_breakdown": {"vector_weight": 0.3, "ai_weight": 0.7, "penalty_applied": True}
+                        "verification": _EMPTY_VERIFICATION,
+                        "score_breakdown": {**_SCORE_WEIGHTS, "penalty_applied": True}
                     })
             enriched_issue["관련과거이슈_상세"] = detailed_past_issues
         
@@ -263,9 +457,13 @@ def _enrich_with_rag_details(issues: List[Dict]) -> List[Dict]:
                                   sum(1 for past in detailed_past_issues 
                                       if past.get("verification", {}).get("is_grounded", False))
         }
-        
+
+        if cache_key[0] is not None:
+            if len(_ENRICH_CACHE) >= _ENRICH_CACHE_MAX:
+                _ENRICH_CACHE.clear()  # 단순 캐시: 가득 차면 비우고 다시 채움
+            _ENRICH_CACHE[cache_key] = enriched_issue
         enriched.append(enriched_issue)
-    
+
     return enriched
 
 def _load_fallback_data():
@@ -274,16 +472,26 @@ def _load_fallback_data():
         data_dir = Path("data2")
         if not data_dir.exists():
             return []
-        
-        # 가장 최근 파이프라인 결과 파일 찾기
-        pipeline_files = list(data_dir.glob("*Pipeline_Results.json"))
-        if not pipeline_files:
-            return []
-        
-        latest_file = max(pipeline_files, key=lambda p: p.stat().st_mtime)
-        
-        with open(latest_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+
+        # 최신 결과 파일 찾기: latest.json 포인터 우선, 없으면 glob 스캔
+        latest_file = None
+        pointer_path = data_dir / "latest.json"
+        if pointer_path.is_file():
+            try:
+                with open(pointer_path, 'r', encoding='utf-8') as f:
+                    latest_name = json.load(f).get("latest_file")
+                if latest_name and (data_dir / latest_name).is_file():
+                    latest_file = data_dir / latest_name
+            except Exception as e:
+                print(f"⚠️ latest.json 포인터 읽기 실패 (glob으로 fallback): {e}")
+
+        if latest_file is None:
+            pipeline_files = list(data_dir.glob("*Pipeline_Results.json"))
+            if not pipeline_files:
+                return []
+            latest_file = max(pipeline_files, key=lambda p: p.stat().st_mtime)
+
+        data = load_result_json(latest_file)
         
         # 🔥 다양한 파일 구조 처리
         issues = []
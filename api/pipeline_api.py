@@ -1,5 +1,8 @@
 # api/pipeline_api.py (수정된 버전)
-from fastapi import APIRouter, BackgroundTasks, HTTPException
+import hashlib
+from pathlib import Path
+
+from fastapi import APIRouter, BackgroundTasks, HTTPException, Request, Response
 from typing import List
 
 from services import pipeline_service
@@ -8,12 +11,21 @@ from models.schemas import CurrentIssue
 router = APIRouter()
 
 @router.get("/today-issues", response_model=List[CurrentIssue])
-async def get_today_issues():
+async def get_today_issues(request: Request, response: Response):
     """
     오늘의 주요 이슈 5개를 RAG 분석 결과와 함께 반환합니다.
     캐시된 최신 데이터를 반환하며, 데이터가 없으면 파이프라인을 실행합니다.
     """
     try:
+        # 최신 결과 포인터(mtime) 기반 ETag - 파이프라인이 돌기 전까지는 304
+        pointer_path = Path("data2/latest.json")
+        if pointer_path.is_file():
+            etag = hashlib.md5(str(pointer_path.stat().st_mtime_ns).encode()).hexdigest()
+            if request.headers.get("if-none-match") == etag:
+                return Response(status_code=304)
+            response.headers["ETag"] = etag
+            response.headers["Cache-Control"] = "max-age=30"
+
         # 🔥 수정: get_latest_analyzed_issues는 async 함수가 아님
         issues = pipeline_service.get_latest_analyzed_issues()
         if not issues:
@@ -62,13 +74,27 @@ async def get_pipeline_status():
         import json
         
         data_dir = Path("data2")
-        pipeline_files = list(data_dir.glob("*Pipeline_Results.json"))
-        
-        if pipeline_files:
-            latest_file = max(pipeline_files, key=lambda f: f.stat().st_mtime)
-            
-            with open(latest_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+
+        # 최신 결과 파일 찾기: latest.json 포인터 우선, 없으면 glob 스캔
+        latest_file = None
+        pointer_path = data_dir / "latest.json"
+        if pointer_path.is_file():
+            try:
+                with open(pointer_path, 'r', encoding='utf-8') as f:
+                    latest_name = json.load(f).get("latest_file")
+                if latest_name and (data_dir / latest_name).is_file():
+                    latest_file = data_dir / latest_name
+            except Exception as e:
+                print(f"⚠️ latest.json 포인터 읽기 실패 (glob으로 fallback): {e}")
+
+        if latest_file is None:
+            pipeline_files = list(data_dir.glob("*Pipeline_Results.json"))
+            if pipeline_files:
+                latest_file = max(pipeline_files, key=lambda f: f.stat().st_mtime)
+
+        if latest_file:
+            from services.pipeline_service import load_result_json
+            data = load_result_json(latest_file)
             
             return {
                 "success": True,
@@ -1,9 +1,13 @@
+import asyncio
+
+import pandas as pd
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from typing import Dict, Any
 
 # 1. 서비스 로직을 임포트합니다.
-from services.simulation_service import simulation_service
+from services.simulation_service import get_simulation_service
 
 # 2. 이 파일의 모든 API 경로를 관리할 APIRouter를 생성합니다.
 router = APIRouter()
@@ -18,6 +22,11 @@ class StockRequest(BaseModel):
     issue_date: str
     industry_name: str
 
+class CommentaryRequest(BaseModel):
+    issue_name: str
+    investment_results: Dict[str, Any]
+    predictions: Dict[str, str]
+
 class CalculationRequest(BaseModel):
     issue_name: str
     issue_date: str
@@ -30,7 +39,8 @@ class CalculationRequest(BaseModel):
 @router.post("/analyze_industries")
 async def analyze_industries_for_issue(request: IndustryRequest):
     """[1단계] 과거 이슈를 받아 AI가 관련 산업 3개를 분석하여 반환"""
-    ai_analysis = simulation_service.analyze_issue_for_industries(request.issue_name, request.issue_description)
+    simulation_service = get_simulation_service()
+    ai_analysis = await simulation_service.analyze_issue_for_industries_async(request.issue_name, request.issue_description)
     if not ai_analysis or not ai_analysis.get("industries"):
         raise HTTPException(status_code=500, detail="AI 산업 분석에 실패했습니다.")
     return {"success": True, "data": ai_analysis}
@@ -38,7 +48,8 @@ async def analyze_industries_for_issue(request: IndustryRequest):
 @router.post("/analyze_stocks")
 async def analyze_stocks_for_industry(request: StockRequest):
     """[2단계] 선택된 산업을 받아 AI가 관련 종목 4개를 분석하고 차트 데이터 반환"""
-    ai_analysis = simulation_service.analyze_industry_for_stocks(request.issue_name, request.industry_name)
+    simulation_service = get_simulation_service()
+    ai_analysis = await simulation_service.analyze_industry_for_stocks_async(request.issue_name, request.industry_name)
     if not ai_analysis or not ai_analysis.get("related_stocks"):
         raise HTTPException(status_code=500, detail="AI 종목 분석에 실패했습니다.")
 
@@ -46,28 +57,54 @@ async def analyze_stocks_for_industry(request: StockRequest):
     if not tickers:
         raise HTTPException(status_code=404, detail="AI가 관련 종목을 찾지 못했습니다.")
 
-    initial_chart = simulation_service.create_stock_chart(request.issue_date, tickers, show_future=False)
+    initial_chart = await asyncio.to_thread(
+        simulation_service.create_stock_chart, request.issue_date, tickers, show_future=False
+    )
 
     return {"success": True, "data": {"ai_analysis": ai_analysis, "tickers": tickers, "chart_image": initial_chart}}
 
+@router.post("/commentary_stream")
+async def stream_investment_commentary(request: CommentaryRequest):
+    """[3단계-스트리밍] AI 코멘터리를 생성되는 대로 토큰 단위로 전송"""
+    simulation_service = get_simulation_service()
+    return StreamingResponse(
+        simulation_service.generate_investment_commentary_stream(
+            request.issue_name, request.investment_results, request.predictions
+        ),
+        media_type="text/plain; charset=utf-8",
+    )
+
 @router.post("/calculate_result")
 async def calculate_simulation_result(request: CalculationRequest):
     """[3단계] 사용자의 투자를 받아 실제 결과와 AI 코멘터리를 함께 반환"""
-    investment_results = simulation_service.get_investment_results(request.issue_date, request.tickers, request.investments)
-    full_chart = simulation_service.create_stock_chart(request.issue_date, request.tickers, show_future=True)
-    ai_commentary = simulation_service.generate_investment_commentary(request.issue_name, investment_results, request.predictions)
+    simulation_service = get_simulation_service()
+    # 차트 생성(yfinance + matplotlib)을 백그라운드 스레드로 띄워 두고,
+    # 결과 계산 → AI 코멘터리 순서로 진행하면서 셋을 최대한 겹쳐 실행
+    chart_task = asyncio.create_task(asyncio.to_thread(
+        simulation_service.create_stock_chart, request.issue_date, request.tickers, show_future=True
+    ))
+    investment_results = await asyncio.to_thread(
+        simulation_service.get_investment_results, request.issue_date, request.tickers, request.investments
+    )
+    ai_commentary, full_chart = await asyncio.gather(
+        simulation_service.generate_investment_commentary_async(request.issue_name, investment_results, request.predictions),
+        chart_task,
+    )
+
+    # 티커 × 컬럼(SoA) DataFrame으로 집계 - 시뮬레이션 수가 늘어도 일괄 벡터 연산 가능
+    results_df = pd.DataFrame(investment_results).T
+    results_df['prediction'] = pd.Series(request.predictions)
+    results_df['invest'] = pd.Series(request.investments)
 
-    total_investment = sum(request.investments.values())
-    total_final_value = sum(res.get('final_value', 0) for res in investment_results.values())
+    total_investment = float(results_df['invest'].fillna(0).sum())
+    total_final_value = float(results_df.get('final_value', pd.Series(dtype=float)).fillna(0).sum())
     total_profit_loss = total_final_value - total_investment
 
-    correct_predictions = 0
-    total_predictions = len(request.predictions)
-    if total_predictions > 0:
-        for ticker, pred in request.predictions.items():
-            if pred == investment_results.get(ticker, {}).get('status'):
-                correct_predictions += 1
-        prediction_accuracy = (correct_predictions / total_predictions * 100)
+    if len(request.predictions) > 0:
+        # 예측한 종목만 분모로 삼아 정확도 계산 (예측 없는 종목은 제외,
+        # status 컬럼이 없는 빈 결과에서도 안전)
+        statuses = results_df.get('status', pd.Series(dtype=object)).reindex(request.predictions.keys())
+        prediction_accuracy = float((pd.Series(request.predictions) == statuses).mean() * 100)
     else:
         prediction_accuracy = 0
 
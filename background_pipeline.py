@@ -7,10 +7,10 @@ integrated_pipeline.py 제거 후 services들을 조합해서 실행
 import os
 import sys
 import time
-import schedule
 import logging
 import asyncio
 import signal
+import threading
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
@@ -20,6 +20,11 @@ project_root = Path(__file__).parent
 if str(project_root) not in sys.path:
     sys.path.insert(0, str(project_root))
 
+try:
+    import uvloop
+except ImportError:
+    uvloop = None  # Windows 등 미지원 환경에서는 기본 asyncio 루프 사용
+
 try:
     from services.pipeline_service import PipelineService
     from services.database_service import DatabaseService
@@ -42,6 +47,10 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+def _new_event_loop():
+    """uvloop이 있으면 C 기반 이벤트 루프 생성, 없으면 기본 asyncio 루프"""
+    return uvloop.new_event_loop() if uvloop else asyncio.new_event_loop()
+
 class BackgroundPipelineExecutor:
     """백그라운드 파이프라인 실행기 - services 조합 버전 (안정성 개선)"""
     
@@ -49,8 +58,15 @@ class BackgroundPipelineExecutor:
         self.pipeline_service = None
         self.db_service = None
         self.is_running = False
-        self.current_loop = None
-        
+
+        # 호출마다 이벤트 루프를 만들고 버리는 대신, 전용 스레드에서
+        # 장수명 루프 하나를 돌려 설정/해제 비용을 1회로 고정합니다.
+        self._loop = _new_event_loop()
+        self._loop_thread = threading.Thread(
+            target=self._run_loop, name="pipeline-loop", daemon=True
+        )
+        self._loop_thread.start()
+
         try:
             # 항상 headless 모드로 실행 (백그라운드 환경)
             self.pipeline_service = PipelineService(headless=True)
@@ -64,7 +80,13 @@ class BackgroundPipelineExecutor:
         except Exception as e:
             logger.error(f"❌ 초기화 실패: {e}")
             raise
-    
+
+    def _run_loop(self):
+        """전용 스레드에서 장수명 이벤트 루프 실행"""
+        asyncio.set_event_loop(self._loop)
+        self._loop.run_forever()
+
+
     async def run_scheduled_update(self):
         """30분마다 실행되는 뉴스 업데이트 (안정성 개선)"""
         if self.is_running:
@@ -78,7 +100,8 @@ class BackgroundPipelineExecutor:
             start_time = datetime.now()
             
             # 🔥 수정: 파이프라인 실행 시 파라미터 제거 (execute_full_pipeline에 파라미터가 없음)
-            result = self.pipeline_service.execute_full_pipeline()
+            # 동기 파이프라인은 워커 스레드에서 실행해 호출한 이벤트 루프를 막지 않음
+            result = await asyncio.to_thread(self.pipeline_service.execute_full_pipeline)
             
             execution_time = datetime.now() - start_time
             
@@ -119,27 +142,22 @@ class BackgroundPipelineExecutor:
     def run_once(self):
         """즉시 1회 실행 (테스트용) - 이벤트 루프 안전 처리"""
         logger.info("🚀 백그라운드 파이프라인 즉시 실행 (services 버전)")
-        
+
         try:
             # 기존 이벤트 루프가 있는지 확인
             try:
-                loop = asyncio.get_running_loop()
+                asyncio.get_running_loop()
                 logger.info("기존 이벤트 루프 감지됨")
                 # 이미 실행 중인 루프에서는 task로 실행
                 task = asyncio.create_task(self.run_scheduled_update())
                 return task
             except RuntimeError:
-                # 실행 중인 루프가 없으면 새로 생성
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                self.current_loop = loop
-                
-                try:
-                    loop.run_until_complete(self.run_scheduled_update())
-                finally:
-                    loop.close()
-                    self.current_loop = None
-                    
+                # 실행 중인 루프가 없으면 전용 루프 스레드에 제출하고 완료까지 대기
+                future = asyncio.run_coroutine_threadsafe(
+                    self.run_scheduled_update(), self._loop
+                )
+                return future.result()
+
         except Exception as e:
             logger.error(f"❌ 즉시 실행 실패: {e}")
             import traceback
@@ -148,10 +166,11 @@ class BackgroundPipelineExecutor:
     def shutdown(self):
         """안전한 종료 처리"""
         logger.info("🛑 백그라운드 파이프라인 종료 중...")
-        
-        if self.current_loop and not self.current_loop.is_closed():
+
+        if self._loop and not self._loop.is_closed():
             try:
-                self.current_loop.stop()
+                self._loop.call_soon_threadsafe(self._loop.stop)
+                self._loop_thread.join(timeout=5)
             except Exception as e:
                 logger.warning(f"⚠️ 이벤트 루프 종료 실패: {e}")
         
@@ -167,21 +186,21 @@ class BackgroundPipelineExecutor:
         
         logger.info("✅ 백그라운드 파이프라인 종료 완료")
 
+# 종료 시그널 플래그 (스케줄러 대기를 즉시 깨우기 위한 Event)
+_shutdown_event = threading.Event()
+
 def signal_handler(signum, frame):
-    """시그널 핸들러 (Ctrl+C 등)"""
+    """시그널 핸들러 (Ctrl+C 등) - 대기 중인 스케줄러를 즉시 깨움"""
     logger.info(f"🔔 종료 시그널 수신: {signum}")
-    sys.exit(0)
+    _shutdown_event.set()
 
 def run_scheduled_wrapper(executor: BackgroundPipelineExecutor):
-    """스케줄 실행을 위한 래퍼 함수"""
+    """스케줄 실행을 위한 래퍼 함수 - 실행기의 장수명 루프에 제출"""
     try:
-        # 새로운 이벤트 루프에서 실행
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        try:
-            loop.run_until_complete(executor.run_scheduled_update())
-        finally:
-            loop.close()
+        future = asyncio.run_coroutine_threadsafe(
+            executor.run_scheduled_update(), executor._loop
+        )
+        future.result()
     except Exception as e:
         logger.error(f"❌ 스케줄 실행 실패: {e}")
 
@@ -217,10 +236,11 @@ def main():
     
     # 스케줄 실행
     logger.info("📅 백그라운드 파이프라인 스케줄러 시작 (30분 간격, services 버전)")
-    
-    # 30분마다 실행 스케줄링
-    schedule.every(30).minutes.do(lambda: run_scheduled_wrapper(executor))
-    
+
+    # 단일 반복 작업이므로 schedule 라이브러리 대신 monotonic 기준 시각 사용
+    # (벽시계 조정/NTP 점프에 영향받지 않고 정확히 30분 간격 유지)
+    RUN_INTERVAL_SECONDS = 30 * 60
+
     # 시작 시 즉시 1회 실행 (선택사항)
     if "--no-initial-run" not in sys.argv:
         logger.info("🎬 시작 시 초기 실행...")
@@ -228,14 +248,20 @@ def main():
             executor.run_once()
         except Exception as e:
             logger.error(f"❌ 초기 실행 실패: {e}")
-    
+
     # 스케줄 유지
     try:
         logger.info("⏰ 스케줄러 대기 중... (Ctrl+C로 종료)")
-        while True:
-            schedule.run_pending()
-            time.sleep(60)  # 1분마다 스케줄 체크
-            
+        next_run = time.monotonic() + RUN_INTERVAL_SECONDS
+        while not _shutdown_event.is_set():
+            now = time.monotonic()
+            if now >= next_run:
+                run_scheduled_wrapper(executor)
+                next_run += RUN_INTERVAL_SECONDS
+                continue
+            # 다음 실행 시각까지 대기 (시그널 수신 시 즉시 깨어남)
+            _shutdown_event.wait(timeout=max(0.1, next_run - now))
+
     except KeyboardInterrupt:
         logger.info("🔔 사용자에 의해 중단됨")
     except Exception as e:
@@ -1,10 +1,64 @@
 # config.py (누락된 설정들 추가)
 
+import functools
 import os
-from dotenv import load_dotenv
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True)
+class Config:
+    """환경변수에서 파생되는 설정값 묶음 (한 번만 읽어 불변으로 보관)"""
+    database: dict
+    openai_api_key: str
+    openai_embedding_model: str
+    pinecone_api_key: str
+    pinecone_index_name: str
+    log_level: str
+    pipeline_schedule_minutes: int
+    pipeline_issues_per_category: int
+    pipeline_target_filtered_count: int
+    crawling_headless: bool
+    crawling_timeout: int
+    simulation_min_investment: int
+    simulation_max_investment: int
+    simulation_max_period_months: int
+
+
+@functools.lru_cache(maxsize=1)
+def get_config() -> Config:
+    """환경변수를 한 번만 읽어 Config를 생성합니다.
+
+    load_dotenv() 파싱과 os.getenv 조회를 import 시점이 아니라 첫 호출로
+    미루고, 이후에는 캐시된 불변 객체를 재사용합니다.
+    """
+    from dotenv import load_dotenv
+    load_dotenv()
+
+    return Config(
+        database={
+            "host": os.getenv("MYSQL_HOST", "localhost"),
+            "port": int(os.getenv("MYSQL_PORT", "3308")),
+            "user": os.getenv("MYSQL_USER", "root"),
+            "password": os.getenv("MYSQL_PASSWORD", "password"),
+            "database": os.getenv("MYSQL_DATABASE", "orda_db"),
+            "charset": "utf8mb4",
+            "autocommit": True
+        },
+        openai_api_key=os.getenv("OPENAI_API_KEY"),
+        openai_embedding_model=os.getenv("OPENAI_EMBEDDING_MODEL", "text-embedding-3-small"),
+        pinecone_api_key=os.getenv("PINECONE_API_KEY"),
+        pinecone_index_name=os.getenv("PINECONE_INDEX_NAME", "ordaproject"),
+        log_level=os.getenv("LOG_LEVEL", "INFO"),
+        pipeline_schedule_minutes=int(os.getenv("PIPELINE_SCHEDULE_MINUTES", "60")),
+        pipeline_issues_per_category=int(os.getenv("PIPELINE_ISSUES_PER_CATEGORY", "10")),
+        pipeline_target_filtered_count=int(os.getenv("PIPELINE_TARGET_FILTERED_COUNT", "5")),
+        crawling_headless=os.getenv("CRAWLING_HEADLESS", "true").lower() == "true",
+        crawling_timeout=int(os.getenv("CRAWLING_TIMEOUT", "30")),
+        simulation_min_investment=int(os.getenv("SIMULATION_MIN_INVESTMENT", "10000")),      # 최소 1만원
+        simulation_max_investment=int(os.getenv("SIMULATION_MAX_INVESTMENT", "100000000")),  # 최대 1억원
+        simulation_max_period_months=int(os.getenv("SIMULATION_MAX_PERIOD_MONTHS", "24")),   # 최대 24개월
+    )
 
-# 환경변수 로드
-load_dotenv()
 
 # FastAPI 설정
 API_TITLE = "오르다 투자 학습 플랫폼 API"
@@ -14,51 +68,44 @@ API_DESCRIPTION = "MySQL + Docker + 백그라운드 자동 파이프라인을 
 # CORS 설정
 CORS_ALLOW_ORIGINS = ["*"]  # 프로덕션에서는 구체적인 도메인으로 제한
 
-# MySQL 데이터베이스 설정
-DATABASE_CONFIG = {
-    "host": os.getenv("MYSQL_HOST", "localhost"),
-    "port": int(os.getenv("MYSQL_PORT", "3308")),
-    "user": os.getenv("MYSQL_USER", "root"),
-    "password": os.getenv("MYSQL_PASSWORD", "password"),
-    "database": os.getenv("MYSQL_DATABASE", "orda_db"),
-    "charset": "utf8mb4",
-    "autocommit": True
-}
-
 # yfinance 종목 코드 설정 (추가)
 YFINANCE_TICKER_SUFFIX_KOSPI = ".KS"     # 코스피 종목 접미사
 YFINANCE_TICKER_SUFFIX_KOSDAQ = ".KQ"    # 코스닥 종목 접미사
 
-# OpenAI 설정
-OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
-OPENAI_EMBEDDING_MODEL = os.getenv("OPENAI_EMBEDDING_MODEL", "text-embedding-3-small")
-
-# Pinecone 설정  
-PINECONE_API_KEY = os.getenv("PINECONE_API_KEY")
-PINECONE_INDEX_NAME = os.getenv("PINECONE_INDEX_NAME", "ordaproject")
-
 # 파일 경로 설정
 DATA_DIR = "data"
 DATA2_DIR = "data2"
 STATIC_DIR = "static"
 
 # 로깅 설정
-LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
 LOG_FILE = "application.log"
 
+# --- 기존 import 사이트 호환용 모듈 속성 (get_config() 값의 별칭) ---
+_cfg = get_config()
+
+# MySQL 데이터베이스 설정
+DATABASE_CONFIG = _cfg.database
+
+# OpenAI 설정
+OPENAI_API_KEY = _cfg.openai_api_key
+OPENAI_EMBEDDING_MODEL = _cfg.openai_embedding_model
+
+# Pinecone 설정
+PINECONE_API_KEY = _cfg.pinecone_api_key
+PINECONE_INDEX_NAME = _cfg.pinecone_index_name
+
+LOG_LEVEL = _cfg.log_level
+
 # 백그라운드 파이프라인 설정
-PIPELINE_SCHEDULE_MINUTES = int(os.getenv("PIPELINE_SCHEDULE_MINUTES", "60"))
-PIPELINE_ISSUES_PER_CATEGORY = int(os.getenv("PIPELINE_ISSUES_PER_CATEGORY", "10"))
-PIPELINE_TARGET_FILTERED_COUNT = int(os.getenv("PIPELINE_TARGET_FILTERED_COUNT", "5"))
+PIPELINE_SCHEDULE_MINUTES = _cfg.pipeline_schedule_minutes
+PIPELINE_ISSUES_PER_CATEGORY = _cfg.pipeline_issues_per_category
+PIPELINE_TARGET_FILTERED_COUNT = _cfg.pipeline_target_filtered_count
 
 # 크롤링 설정
-CRAWLING_HEADLESS = os.getenv("CRAWLING_HEADLESS", "true").lower() == "true"
-CRAWLING_TIMEOUT = int(os.getenv("CRAWLING_TIMEOUT", "30"))
+CRAWLING_HEADLESS = _cfg.crawling_headless
+CRAWLING_TIMEOUT = _cfg.crawling_timeout
 
 # 시뮬레이션 설정
-SIMULATION_MIN_INVESTMENT = int(os.getenv("SIMULATION_MIN_INVESTMENT", "10000"))      # 최소 1만원
-SIMULATION_MAX_INVESTMENT = int(os.getenv("SIMULATION_MAX_INVESTMENT", "100000000"))  # 최대 1억원
-SIMULATION_MAX_PERIOD_MONTHS = int(os.getenv("SIMULATION_MAX_PERIOD_MONTHS", "24"))   # 최대 24개월
-
-print(f"✅ Config 로드 완료 - MySQL 포트: {DATABASE_CONFIG['port']}")
-print(f"📊 yfinance 설정 - KOSPI: {YFINANCE_TICKER_SUFFIX_KOSPI}, KOSDAQ: {YFINANCE_TICKER_SUFFIX_KOSDAQ}")
\ No newline at end of file
+SIMULATION_MIN_INVESTMENT = _cfg.simulation_min_investment
+SIMULATION_MAX_INVESTMENT = _cfg.simulation_max_investment
+SIMULATION_MAX_PERIOD_MONTHS = _cfg.simulation_max_period_months
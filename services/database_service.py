@@ -3,53 +3,116 @@ MySQL 데이터베이스 서비스 - 간단한 버전
 백그라운드 파이프라인 결과 저장 + API 조회용
 """
 
+import asyncio
+import logging
+from collections import defaultdict
+from functools import lru_cache
 import mysql.connector
-from mysql.connector import Error
+from mysql.connector import Error, pooling
 from typing import List, Dict, Optional
 import json
 from datetime import datetime
 from config import DATABASE_CONFIG
 
+# ISO-8601 파싱 전용 C 확장 (설치돼 있으면 stdlib보다 수 배 빠르고 'Z'도 처리)
+try:
+    import ciso8601
+except ImportError:
+    ciso8601 = None
+
+logger = logging.getLogger(__name__)
+
+def _parse_iso(date_str: Optional[str]) -> Optional[datetime]:
+    """ISO-8601 문자열 파싱 (실패/빈 값은 None)"""
+    if not date_str:
+        return None
+    try:
+        if ciso8601 is not None:
+            return ciso8601.parse_datetime(date_str)
+        return datetime.fromisoformat(date_str.replace('Z', '+00:00'))
+    except ValueError:
+        return None
+
 class DatabaseService:
     """MySQL 기반 데이터베이스 서비스"""
     
+    POOL_SIZE = 8
+
     def __init__(self):
         self.connection = None
+        self.pool = None
         self._initialized = False
-    
+
     def initialize(self):
-        """MySQL 연결 초기화"""
+        """MySQL 연결 초기화 (쓰기용 연결 + 조회용 커넥션 풀)"""
         try:
             self.connection = mysql.connector.connect(**DATABASE_CONFIG)
             if self.connection.is_connected():
                 self._initialized = True
-                print(f"✅ MySQL 연결 성공 (포트: {DATABASE_CONFIG['port']})")
+                logger.info("✅ MySQL 연결 성공 (포트: %s)", DATABASE_CONFIG["port"])
                 self._create_tables()
+
+                # 조회 경로가 연결을 재사용하도록 커넥션 풀 생성
+                try:
+                    self.pool = pooling.MySQLConnectionPool(
+                        pool_name="orda_pool",
+                        pool_size=self.POOL_SIZE,
+                        pool_reset_session=True,
+                        **DATABASE_CONFIG
+                    )
+                    logger.info("✅ MySQL 커넥션 풀 생성 완료 (크기: %d)", self.POOL_SIZE)
+                except Error as pool_error:
+                    logger.warning("⚠️ 커넥션 풀 생성 실패 (단일 연결로 동작): %s", pool_error)
+                    self.pool = None
         except Error as e:
-            print(f"❌ MySQL 연결 실패: {e}")
+            logger.error("❌ MySQL 연결 실패: %s", e)
             self._initialized = False
+
+    def _acquire_connection(self):
+        """조회용 연결 획득 (풀이 있으면 풀에서, 없으면 공유 연결 사용)"""
+        if self.pool is not None:
+            try:
+                return self.pool.get_connection()
+            except Error as e:
+                logger.warning("⚠️ 풀 연결 획득 실패 (공유 연결 사용): %s", e)
+        return self.connection
+
+    def _release_connection(self, conn):
+        """풀에서 빌린 연결만 반환 (공유 연결은 유지)"""
+        if conn is not self.connection:
+            try:
+                conn.close()  # PooledMySQLConnection.close()는 풀로 반환
+            except Error:
+                pass
     
     def is_initialized(self) -> bool:
-        """연결 상태 확인"""
-        try:
-            return (self._initialized and 
-                   self.connection and 
-                   self.connection.is_connected())
-        except:
-            return False
+        """연결 상태 확인 (캐시된 플래그만 확인)
+
+        is_connected()는 호출마다 서버에 COM_PING 왕복을 발생시키는데,
+        이 메서드는 헬스체크와 모든 저장/조회 경로에서 불리므로 네트워크
+        왕복 없이 초기화 플래그만 봅니다. 죽은 연결은 실제 쿼리가 실패할 때
+        드러나며, 그때 풀에서 새 연결을 받아 복구됩니다.
+        """
+        return bool(self._initialized and self.connection)
     
     async def test_connection(self):
-        """연결 테스트"""
+        """연결 테스트 (blocking 쿼리는 스레드에서 실행하여 이벤트 루프 보호)"""
+        return await asyncio.to_thread(self._test_connection_blocking)
+
+    def _test_connection_blocking(self):
+        """연결 테스트 (동기 버전)"""
         if not self.is_initialized():
             raise Exception("데이터베이스가 연결되지 않았습니다.")
-        
-        cursor = self.connection.cursor()
+
+        conn = self._acquire_connection()
+        cursor = conn.cursor()
         try:
             cursor.execute("SELECT 1")
             cursor.fetchone()
             return True
         finally:
             cursor.close()
+            self._release_connection(conn)
     
     def _create_tables(self):
         """필요한 테이블 생성"""
@@ -69,7 +132,8 @@ class DatabaseService:
                 ranking INT,
                 rag_confidence DECIMAL(4,1),
                 created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+                INDEX idx_ranking (ranking)
             ) ENGINE=InnoDB CHARSET=utf8mb4
             """)
             
@@ -81,10 +145,11 @@ class DatabaseService:
                 industry_name VARCHAR(200),
                 final_score DECIMAL(4,1),
                 ai_reason TEXT,
-                FOREIGN KEY (news_issue_id) REFERENCES news_issues(id) ON DELETE CASCADE
+                FOREIGN KEY (news_issue_id) REFERENCES news_issues(id) ON DELETE CASCADE,
+                INDEX idx_ri_ni_fs (news_issue_id, final_score DESC)
             ) ENGINE=InnoDB CHARSET=utf8mb4
             """)
-            
+
             # 관련 과거 이슈 테이블
             cursor.execute("""
             CREATE TABLE IF NOT EXISTS related_past_issues (
@@ -94,10 +159,11 @@ class DatabaseService:
                 final_score DECIMAL(4,1),
                 period VARCHAR(100),
                 ai_reason TEXT,
-                FOREIGN KEY (news_issue_id) REFERENCES news_issues(id) ON DELETE CASCADE
+                FOREIGN KEY (news_issue_id) REFERENCES news_issues(id) ON DELETE CASCADE,
+                INDEX idx_rpi_ni_fs (news_issue_id, final_score DESC)
             ) ENGINE=InnoDB CHARSET=utf8mb4
             """)
-            
+
             # 파이프라인 로그 테이블
             cursor.execute("""
             CREATE TABLE IF NOT EXISTS pipeline_logs (
@@ -112,11 +178,23 @@ class DatabaseService:
             ) ENGINE=InnoDB CHARSET=utf8mb4
             """)
             
+            # 기존 배포본처럼 인덱스 없이 만들어진 테이블에도 인덱스 보강
+            # (이미 있으면 1061 Duplicate key name 오류를 무시)
+            for ddl in (
+                "CREATE INDEX idx_ranking ON news_issues (ranking)",
+                "CREATE INDEX idx_ri_ni_fs ON related_industries (news_issue_id, final_score DESC)",
+                "CREATE INDEX idx_rpi_ni_fs ON related_past_issues (news_issue_id, final_score DESC)",
+            ):
+                try:
+                    cursor.execute(ddl)
+                except Error:
+                    pass
+
             self.connection.commit()
-            print("✅ MySQL 테이블 생성 완료")
+            logger.info("✅ MySQL 테이블 생성 완료")
             
         except Error as e:
-            print(f"❌ 테이블 생성 실패: {e}")
+            logger.error("❌ 테이블 생성 실패: %s", e)
             raise
         finally:
             cursor.close()
@@ -126,68 +204,120 @@ class DatabaseService:
     # ========================================================================
     
     async def save_pipeline_result(self, result: Dict):
-        """파이프라인 결과를 MySQL에 저장"""
+        """파이프라인 결과를 MySQL에 저장 (blocking 쿼리는 스레드에서 실행)"""
+        return await asyncio.to_thread(self._save_pipeline_result_blocking, result)
+
+    def _save_pipeline_result_blocking(self, result: Dict):
+        """파이프라인 결과 저장 (동기 버전)
+
+        쓰기도 풀에서 빌린 연결을 사용해, 동시에 들어온 조회 요청과
+        공유 연결 하나를 두고 직렬화되지 않도록 합니다.
+        """
         if not self.is_initialized():
             raise Exception("데이터베이스가 연결되지 않았습니다.")
-        
-        cursor = self.connection.cursor()
-        
+
+        conn = self._acquire_connection()
+        # 주의: 여기서는 prepared=True를 쓰면 안 됩니다. prepared 커서의
+        # executemany는 행마다 문을 개별 실행해서 다중 행 INSERT 재작성이
+        # 사라지고, lastrowid 기반 부모 id 산술(_bulk_save_issues)이 깨집니다.
+        cursor = conn.cursor()
+
         try:
-            print("💾 MySQL에 파이프라인 결과 저장 중...")
-            
+            logger.info("💾 MySQL에 파이프라인 결과 저장 중...")
+
+            # DATABASE_CONFIG가 autocommit=True라서 DELETE가 개별 커밋되면
+            # 삽입이 끝나기 전까지 조회가 빈 결과를 보게 됩니다.
+            # 삭제+삽입을 하나의 트랜잭션으로 묶어 원자적으로 교체합니다.
+            conn.start_transaction()
+
             # 기존 데이터 삭제 (최신 상태 유지)
             cursor.execute("DELETE FROM related_past_issues")
             cursor.execute("DELETE FROM related_industries")
             cursor.execute("DELETE FROM news_issues")
-            
+
             # API 데이터 추출
             api_data = result.get("api_ready_data", {})
             selected_issues = api_data.get("data", {}).get("selected_issues", [])
-            
-            # 새 뉴스 이슈들 저장
-            for issue_data in selected_issues:
-                # 1. 뉴스 이슈 저장
-                issue_id = self._save_news_issue(cursor, issue_data)
-                
-                # 2. 관련 산업 저장
-                for industry in issue_data.get("관련산업", []):
-                    self._save_related_industry(cursor, issue_id, industry)
-                
-                # 3. 관련 과거 이슈 저장
-                for past_issue in issue_data.get("관련과거이슈", []):
-                    self._save_related_past_issue(cursor, issue_id, past_issue)
-            
+
+            # 새 뉴스 이슈들 저장 (행별 INSERT 대신 테이블당 executemany 1회)
+            self._bulk_save_issues(cursor, selected_issues)
+
             # 파이프라인 로그 저장
             self._save_pipeline_log(cursor, result, api_data)
-            
-            self.connection.commit()
-            print(f"✅ MySQL 저장 완료: {len(selected_issues)}개 이슈")
-            
+
+            conn.commit()
+            logger.info("✅ MySQL 저장 완료: %d개 이슈", len(selected_issues))
+
         except Error as e:
-            self.connection.rollback()
-            print(f"❌ MySQL 저장 실패: {e}")
+            conn.rollback()
+            logger.error("❌ MySQL 저장 실패: %s", e)
             raise
         finally:
             cursor.close()
+            self._release_connection(conn)
     
-    def _save_news_issue(self, cursor, issue_data: Dict) -> int:
-        """뉴스 이슈 저장"""
-        query = """
-        INSERT INTO news_issues 
-        (issue_number, title, content, category, extracted_at, 
+    def _bulk_save_issues(self, cursor, selected_issues: List[Dict]):
+        """이슈/관련산업/관련과거이슈를 테이블별 executemany로 일괄 저장
+
+        이슈 N개 × (1 + 산업 I + 과거 P)번의 왕복 대신 INSERT 3번으로 저장합니다.
+        단일 다중행 INSERT의 AUTO_INCREMENT ID는 연속이므로 lastrowid부터
+        순서대로 자식 행의 FK를 계산할 수 있습니다.
+        """
+        if not selected_issues:
+            return
+
+        news_rows = [self._news_issue_row(issue_data) for issue_data in selected_issues]
+        cursor.executemany("""
+        INSERT INTO news_issues
+        (issue_number, title, content, category, extracted_at,
          stock_relevance_score, ranking, rag_confidence)
         VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-        """
-        
+        """, news_rows)
+
+        first_id = cursor.lastrowid
+        issue_ids = range(first_id, first_id + len(news_rows))
+
+        industry_rows = []
+        past_rows = []
+        for issue_id, issue_data in zip(issue_ids, selected_issues):
+            for industry in issue_data.get("관련산업", []):
+                industry_rows.append((
+                    issue_id,
+                    industry.get("name", "")[:200],
+                    float(industry.get("final_score", 0)),
+                    industry.get("ai_reason", "")
+                ))
+            for past_issue in issue_data.get("관련과거이슈", []):
+                past_rows.append((
+                    issue_id,
+                    past_issue.get("name", "")[:200],
+                    float(past_issue.get("final_score", 0)),
+                    past_issue.get("period", ""),
+                    past_issue.get("ai_reason", "")
+                ))
+
+        if industry_rows:
+            cursor.executemany("""
+            INSERT INTO related_industries
+            (news_issue_id, industry_name, final_score, ai_reason)
+            VALUES (%s, %s, %s, %s)
+            """, industry_rows)
+
+        if past_rows:
+            cursor.executemany("""
+            INSERT INTO related_past_issues
+            (news_issue_id, issue_name, final_score, period, ai_reason)
+            VALUES (%s, %s, %s, %s, %s)
+            """, past_rows)
+
+    def _news_issue_row(self, issue_data: Dict) -> tuple:
+        """news_issues INSERT용 값 튜플 구성"""
         # 날짜 처리
         extracted_at = issue_data.get("추출시간")
         if isinstance(extracted_at, str):
-            try:
-                extracted_at = datetime.fromisoformat(extracted_at.replace('Z', '+00:00'))
-            except:
-                extracted_at = datetime.now()
-        
-        values = (
+            extracted_at = _parse_iso(extracted_at) or datetime.now()
+
+        return (
             issue_data.get("이슈번호", 0),
             issue_data.get("제목", "")[:500],  # 길이 제한
             issue_data.get("내용", ""),
@@ -197,45 +327,7 @@ class DatabaseService:
             issue_data.get("순위", 0),
             float(issue_data.get("RAG분석신뢰도", 0))
         )
-        
-        cursor.execute(query, values)
-        return cursor.lastrowid
-    
-    def _save_related_industry(self, cursor, news_issue_id: int, industry: Dict):
-        """관련 산업 저장"""
-        query = """
-        INSERT INTO related_industries 
-        (news_issue_id, industry_name, final_score, ai_reason)
-        VALUES (%s, %s, %s, %s)
-        """
-        
-        values = (
-            news_issue_id,
-            industry.get("name", "")[:200],
-            float(industry.get("final_score", 0)),
-            industry.get("ai_reason", "")
-        )
-        
-        cursor.execute(query, values)
-    
-    def _save_related_past_issue(self, cursor, news_issue_id: int, past_issue: Dict):
-        """관련 과거 이슈 저장"""
-        query = """
-        INSERT INTO related_past_issues 
-        (news_issue_id, issue_name, final_score, period, ai_reason)
-        VALUES (%s, %s, %s, %s, %s)
-        """
-        
-        values = (
-            news_issue_id,
-            past_issue.get("name", "")[:200],
-            float(past_issue.get("final_score", 0)),
-            past_issue.get("period", ""),
-            past_issue.get("ai_reason", "")
-        )
-        
-        cursor.execute(query, values)
-    
+
     def _save_pipeline_log(self, cursor, result: Dict, api_data: Dict):
         """파이프라인 로그 저장"""
         query = """
@@ -244,18 +336,10 @@ class DatabaseService:
         VALUES (%s, %s, %s, %s, %s, %s)
         """
         
-        def parse_datetime(date_str):
-            if not date_str:
-                return None
-            try:
-                return datetime.fromisoformat(date_str.replace('Z', '+00:00'))
-            except:
-                return None
-        
         values = (
             result.get("pipeline_id", ""),
-            parse_datetime(result.get("started_at")),
-            parse_datetime(result.get("completed_at")),
+            _parse_iso(result.get("started_at")),
+            _parse_iso(result.get("completed_at")),
             result.get("final_status", ""),
             api_data.get("data", {}).get("total_crawled", 0),
             api_data.get("data", {}).get("selected_count", 0)
@@ -268,63 +352,84 @@ class DatabaseService:
     # ========================================================================
     
     async def get_latest_news_issues(self) -> List[Dict]:
-        """최신 뉴스 이슈들 조회"""
+        """최신 뉴스 이슈들 조회 (blocking 쿼리는 스레드에서 실행)"""
+        return await asyncio.to_thread(self._get_latest_news_issues_blocking)
+
+    def _get_latest_news_issues_blocking(self) -> List[Dict]:
+        """최신 뉴스 이슈들 조회 (동기 버전)"""
         if not self.is_initialized():
             return []
-        
-        cursor = self.connection.cursor(dictionary=True)
-        
+
+        conn = self._acquire_connection()
+        cursor = conn.cursor(dictionary=True)
+
         try:
             # 뉴스 이슈 조회
             cursor.execute("""
-            SELECT * FROM news_issues 
+            SELECT * FROM news_issues
             ORDER BY ranking ASC
             """)
             news_issues = cursor.fetchall()
-            
-            # 각 이슈에 관련 정보 추가
+
+            if not news_issues:
+                return news_issues
+
+            # 자식 테이블은 이슈별 쿼리(N+1) 대신 IN(...) 일괄 조회 후 파이썬에서 그룹핑
+            issue_ids = [issue['id'] for issue in news_issues]
+            placeholders = ','.join(['%s'] * len(issue_ids))
+
+            cursor.execute(f"""
+            SELECT news_issue_id, industry_name, final_score, ai_reason
+            FROM related_industries
+            WHERE news_issue_id IN ({placeholders})
+            ORDER BY final_score DESC
+            """, issue_ids)
+            industries_by_issue = defaultdict(list)
+            for row in cursor.fetchall():
+                industries_by_issue[row.pop('news_issue_id')].append(row)
+
+            cursor.execute(f"""
+            SELECT news_issue_id, issue_name, final_score, period, ai_reason
+            FROM related_past_issues
+            WHERE news_issue_id IN ({placeholders})
+            ORDER BY final_score DESC
+            """, issue_ids)
+            past_issues_by_issue = defaultdict(list)
+            for row in cursor.fetchall():
+                past_issues_by_issue[row.pop('news_issue_id')].append(row)
+
+            # 각 이슈에 관련 정보 부착
             for issue in news_issues:
-                issue_id = issue['id']
-                
-                # 관련 산업 조회
-                cursor.execute("""
-                SELECT industry_name, final_score, ai_reason
-                FROM related_industries 
-                WHERE news_issue_id = %s 
-                ORDER BY final_score DESC
-                """, (issue_id,))
-                issue['related_industries'] = cursor.fetchall()
-                
-                # 관련 과거 이슈 조회
-                cursor.execute("""
-                SELECT issue_name, final_score, period, ai_reason
-                FROM related_past_issues 
-                WHERE news_issue_id = %s 
-                ORDER BY final_score DESC
-                """, (issue_id,))
-                issue['related_past_issues'] = cursor.fetchall()
-                
+                issue['related_industries'] = industries_by_issue.get(issue['id'], [])
+                issue['related_past_issues'] = past_issues_by_issue.get(issue['id'], [])
+
                 # 날짜 형식 변환
                 if issue.get('extracted_at'):
                     issue['extracted_at'] = issue['extracted_at'].isoformat()
                 if issue.get('updated_at'):
                     issue['updated_at'] = issue['updated_at'].isoformat()
-            
+
             return news_issues
             
         except Error as e:
-            print(f"❌ 뉴스 조회 실패: {e}")
+            logger.error("❌ 뉴스 조회 실패: %s", e)
             return []
         finally:
             cursor.close()
+            self._release_connection(conn)
     
     async def get_issue_with_relations(self, issue_id: int) -> Optional[Dict]:
-        """특정 이슈 상세 조회"""
+        """특정 이슈 상세 조회 (blocking 쿼리는 스레드에서 실행)"""
+        return await asyncio.to_thread(self._get_issue_with_relations_blocking, issue_id)
+
+    def _get_issue_with_relations_blocking(self, issue_id: int) -> Optional[Dict]:
+        """특정 이슈 상세 조회 (동기 버전)"""
         if not self.is_initialized():
             return None
-        
-        cursor = self.connection.cursor(dictionary=True)
-        
+
+        conn = self._acquire_connection()
+        cursor = conn.cursor(dictionary=True)
+
         try:
             # 뉴스 이슈 기본 정보
             cursor.execute("SELECT * FROM news_issues WHERE id = %s", (issue_id,))
@@ -350,21 +455,27 @@ class DatabaseService:
             return issue
             
         except Error as e:
-            print(f"❌ 이슈 상세 조회 실패: {e}")
+            logger.error("❌ 이슈 상세 조회 실패: %s", e)
             return None
         finally:
             cursor.close()
+            self._release_connection(conn)
     
     async def get_latest_pipeline_log(self) -> Optional[Dict]:
-        """최근 파이프라인 로그 조회"""
+        """최근 파이프라인 로그 조회 (blocking 쿼리는 스레드에서 실행)"""
+        return await asyncio.to_thread(self._get_latest_pipeline_log_blocking)
+
+    def _get_latest_pipeline_log_blocking(self) -> Optional[Dict]:
+        """최근 파이프라인 로그 조회 (동기 버전)"""
         if not self.is_initialized():
             return None
-        
-        cursor = self.connection.cursor(dictionary=True)
-        
+
+        conn = self._acquire_connection()
+        cursor = conn.cursor(dictionary=True)
+
         try:
             cursor.execute("""
-            SELECT * FROM pipeline_logs 
+            SELECT * FROM pipeline_logs
             ORDER BY created_at DESC 
             LIMIT 1
             """)
@@ -379,16 +490,13 @@ class DatabaseService:
             return result
             
         except Error as e:
-            print(f"❌ 파이프라인 로그 조회 실패: {e}")
+            logger.error("❌ 파이프라인 로그 조회 실패: %s", e)
             return None
         finally:
             cursor.close()
+            self._release_connection(conn)
 
-# 전역 인스턴스
-_database_service = None
-
+# 전역 인스턴스 (lru_cache가 C 레벨에서 싱글톤 조회를 처리)
+@lru_cache(maxsize=1)
 def get_database_service() -> DatabaseService:
-    global _database_service
-    if _database_service is None:
-        _database_service = DatabaseService()
-    return _database_service
\ No newline at end of file
+    return DatabaseService()
\ No newline at end of file
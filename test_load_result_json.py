@@ -0,0 +1,27 @@
+# test_load_result_json.py
+"""load_result_json 회귀 테스트
+
+orjson 경로가 mmap 객체를 직접 넘겨 모든 파일 폴백 조회가 깨졌던
+회귀를 막기 위해, 실제 data2의 Pipeline_Results 파일로 파싱을 검증합니다.
+실행: python test_load_result_json.py
+"""
+from pathlib import Path
+
+from services.pipeline_service import load_result_json
+
+result_files = list(Path("data2").glob("*_Pipeline_Results.json"))
+assert result_files, "❌ data2에 Pipeline_Results 파일이 없습니다."
+
+target = max(result_files, key=lambda f: f.stat().st_mtime)
+print(f"📂 대상 파일: {target}")
+
+data = load_result_json(target)
+assert isinstance(data, dict), f"❌ dict가 아님: {type(data)}"
+assert data, "❌ 빈 결과"
+assert "selected_issues" in data or "api_ready_data" in data, \
+    f"❌ 알 수 없는 결과 구조: {list(data)[:5]}"
+
+# 같은 파일 재호출은 mtime 캐시에서 동일 객체를 반환해야 함
+assert load_result_json(target) is data, "❌ mtime 캐시가 동작하지 않음"
+
+print(f"✅ load_result_json 검증 완료: 이슈 {len(data.get('selected_issues', []))}개")